@@ -36,7 +36,6 @@ import subprocess
 import sys
 import time
 import pexpect
-import yaml
 
 from jujupy.backend import (
     JujuBackend,
@@ -69,6 +68,8 @@ from jujupy.utility import (
     JujuResourceTimeout,
     pause,
     qualified_model_name,
+    safe_dump,
+    safe_load,
     skip_on_missing_file,
     split_address_port,
     temp_yaml_file,
@@ -99,18 +100,20 @@ LXC_MACHINE = 'lxc'
 LXD_MACHINE = 'lxd'
 
 _DEFAULT_BUNDLE_TIMEOUT = 3600
+_DEFAULT_TEARDOWN_TIMEOUT = 600
+# Providers which need longer than the default to tear down resources.
+_TEARDOWN_TIMEOUTS = {
+    'azure': 2700,
+    'gce': 1200,
+    }
 
 log = logging.getLogger("jujupy")
 
 
 def get_teardown_timeout(client):
     """Return the timeout need by the client to teardown resources."""
-    if client.env.provider == 'azure':
-        return 2700
-    elif client.env.provider == 'gce':
-        return 1200
-    else:
-        return 600
+    return _TEARDOWN_TIMEOUTS.get(
+        client.env.provider, _DEFAULT_TEARDOWN_TIMEOUT)
 
 
 def parse_new_state_server_from_error(error):
@@ -250,7 +253,7 @@ class JujuData:
     def load_yaml(self):
         try:
             with open(os.path.join(self.juju_home, 'credentials.yaml')) as f:
-                self.credentials = yaml.safe_load(f)
+                self.credentials = safe_load(f)
         except IOError as e:
             if e.errno != errno.ENOENT:
                 raise RuntimeError(
@@ -262,7 +265,7 @@ class JujuData:
         """Read and return clouds.yaml as a Python dict."""
         try:
             with open(os.path.join(self.juju_home, 'clouds.yaml')) as f:
-                return yaml.safe_load(f)
+                return safe_load(f)
         except IOError as e:
             if e.errno != errno.ENOENT:
                 raise RuntimeError(
@@ -317,7 +320,7 @@ class JujuData:
     @classmethod
     def for_existing(cls, juju_data_dir, controller_name, model_name):
         with open(get_bootstrap_config_path(juju_data_dir)) as f:
-            all_bootstrap = yaml.load(f)
+            all_bootstrap = safe_load(f)
         ctrl_config = all_bootstrap['controllers'][controller_name]
         config = ctrl_config['controller-config']
         # config is expected to have a 1.x style of config, so mash up
@@ -335,13 +338,13 @@ class JujuData:
     def dump_yaml(self, path):
         """Dump the configuration files to the specified path."""
         with open(os.path.join(path, 'credentials.yaml'), 'w') as f:
-            yaml.safe_dump(self.credentials, f)
+            safe_dump(self.credentials, f)
         self.write_clouds(path, self.clouds)
 
     @staticmethod
     def write_clouds(path, clouds):
         with open(os.path.join(path, 'clouds.yaml'), 'w') as f:
-            yaml.safe_dump(clouds, f)
+            safe_dump(clouds, f)
 
     def find_endpoint_cloud(self, cloud_type, endpoint):
         for cloud, cloud_config in self.clouds['clouds'].items():
@@ -1056,7 +1059,7 @@ class ModelClient:
                 self.env.controller.name, model_name or self.env.environment),
             '--format', 'yaml',
             include_e=False)
-        return yaml.safe_load(model_details)
+        return safe_load(model_details)
 
     @staticmethod
     def _dict_as_option_strings(options):
@@ -1067,7 +1070,7 @@ class ModelClient:
         self.juju('config', (service,) + option_strings)
 
     def get_config(self, service):
-        return yaml.safe_load(self.get_juju_output('config', service))
+        return safe_load(self.get_juju_output('config', service))
 
     def get_service_config(self, service, timeout=60):
         for ignored in until_timeout(timeout):
@@ -1085,7 +1088,7 @@ class ModelClient:
 
     def get_model_config(self):
         """Return the value of the environment's configured options."""
-        return yaml.safe_load(
+        return safe_load(
             self.get_juju_output('model-config', '--format', 'yaml'))
 
     def get_env_option(self, option):
@@ -1124,7 +1127,7 @@ class ModelClient:
         gjo_args = ('--format', 'yaml') + cloud_region + (model_key,)
         raw_yaml = self.get_juju_output('model-defaults', *gjo_args,
                                         include_e=False)
-        return yaml.safe_load(raw_yaml)
+        return safe_load(raw_yaml)
 
     def set_model_defaults(self, model_key, value, cloud=None, region=None):
         """Set a model-defaults entry for model_key to value.
@@ -1248,7 +1251,7 @@ class ModelClient:
         args = ('--format', 'yaml', service_or_unit)
         if details:
             args = args + ('--details',)
-        return yaml.safe_load(self.get_juju_output('list-resources', *args))
+        return safe_load(self.get_juju_output('list-resources', *args))
 
     def wait_for_resource(self, resource_id, service_or_unit, timeout=60):
         log.info('Waiting for resource. Resource id:{}'.format(resource_id))
@@ -1429,7 +1432,7 @@ class ModelClient:
         output = self.get_juju_output(
             'list-models', '-c', self.env.controller.name, '--format', 'yaml',
             include_e=False, timeout=120)
-        models = yaml.safe_load(output)
+        models = safe_load(output)
         return models
 
     def _get_models(self):
@@ -1477,7 +1480,7 @@ class ModelClient:
         model = self._cmd_model(True, False)
         output_yaml = self.get_juju_output(
             'show-model', '--format', 'yaml', model, include_e=False)
-        output = yaml.safe_load(output_yaml)
+        output = safe_load(output_yaml)
         return output[name]['model-uuid']
 
     def get_controller_uuid(self):
@@ -1487,13 +1490,13 @@ class ModelClient:
             name,
             '--format', 'yaml',
             include_e=False)
-        output = yaml.safe_load(output_yaml)
+        output = safe_load(output_yaml)
         return output[name]['details']['uuid']
 
     def get_controller_model_uuid(self):
         output_yaml = self.get_juju_output(
             'show-model', 'controller', '--format', 'yaml', include_e=False)
-        output = yaml.safe_load(output_yaml)
+        output = safe_load(output_yaml)
         return output['controller']['model-uuid']
 
     def get_controller_client(self):
@@ -1513,7 +1516,7 @@ class ModelClient:
         controller = self.env.controller.name
         output = self.get_juju_output(
             'show-controller', controller, include_e=False)
-        info = yaml.safe_load(output)
+        info = safe_load(output)
         endpoint = info[controller]['details']['api-endpoints'][0]
         return split_address_port(endpoint)
 
@@ -1703,7 +1706,7 @@ class ModelClient:
         Returns the yaml output of the fetched action.
         """
         out = self.get_juju_output("show-action-output", id, "--wait", timeout)
-        status = yaml.safe_load(out)["status"]
+        status = safe_load(out)["status"]
         if status != "completed":
             action_name = '' if not action else ' "{}"'.format(action)
             raise Exception(
@@ -1756,7 +1759,7 @@ class ModelClient:
             return responses
 
     def list_space(self):
-        return yaml.safe_load(self.get_juju_output('list-space'))
+        return safe_load(self.get_juju_output('list-space'))
 
     def add_space(self, space):
         self.juju('add-space', (space),)
@@ -2060,7 +2063,7 @@ class ModelClient:
         """Return data on a machine as a dict."""
         text = self.get_juju_output('show-machine', machine,
                                     '--format', 'yaml')
-        return yaml.safe_load(text)
+        return safe_load(text)
 
     def ssh_keys(self, full=False):
         """Give the ssh keys registered for the current model."""
@@ -2085,7 +2088,7 @@ class ModelClient:
         """List all the commands disabled on the model."""
         raw = self.get_juju_output('list-disabled-commands',
                                    '--format', 'yaml')
-        return yaml.safe_load(raw)
+        return safe_load(raw)
 
     def disable_command(self, command_set, message=''):
         """Disable a command-set."""
@@ -20,7 +20,7 @@ import os
 import re
 import subprocess
 
-import yaml
+from jujupy.utility import safe_load
 
 
 class NoSuchEnvironment(Exception):
@@ -75,7 +75,7 @@ def get_environments():
     """Return the environments for juju."""
     home = get_juju_home()
     with open(get_environments_path(home)) as env:
-        return yaml.safe_load(env)['environments']
+        return safe_load(env)['environments']
 
 
 def default_env():
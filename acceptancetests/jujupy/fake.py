@@ -27,7 +27,6 @@ import subprocess
 import uuid
 
 import pexpect
-import yaml
 
 from jujupy import (
     ModelClient,
@@ -36,6 +35,10 @@ from jujupy import (
 from jujupy.exceptions import (
     SoftDeadlineExceeded,
 )
+from jujupy.utility import (
+    safe_dump,
+    safe_load,
+    )
 from jujupy.wait_condition import (
     CommandTime,
     )
@@ -745,7 +748,7 @@ class FakeBackend:
         parser.add_argument('--upload-tools', action='store_true')
         parsed = parser.parse_args(args)
         with open(parsed.config) as config_file:
-            config = yaml.safe_load(config_file)
+            config = safe_load(config_file)
         cloud_region = parsed.cloud_name_region.split('/', 1)
         cloud = cloud_region[0]
         # Although they are specified with specific arguments instead of as
@@ -1046,11 +1049,11 @@ class FakeBackend:
                 return 'Codename:\t{}\n'.format(
                     model_state.model_config['default-series'])
             if command in ('model-config', 'get-model-config'):
-                return yaml.safe_dump(model_state.model_config)
+                return safe_dump(model_state.model_config)
             if command == 'show-controller':
-                return yaml.safe_dump(self.make_controller_dict(args[0]))
+                return safe_dump(self.make_controller_dict(args[0]))
             if command == 'list-models':
-                return yaml.safe_dump(self.list_models())
+                return safe_dump(self.list_models())
             if command == 'list-users':
                 return json.dumps(self.list_users())
             if command == 'show-model':
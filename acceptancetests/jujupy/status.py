@@ -15,7 +15,6 @@
 
 import json
 import re
-import yaml
 
 from collections import defaultdict
 from datetime import datetime
@@ -36,6 +35,7 @@ from jujupy.exceptions import (
 )
 from jujupy.utility import (
     _dns_name_for_machine,
+    safe_load,
     )
 
 __metaclass__ = type
@@ -173,7 +173,7 @@ class Status:
             # parsing as JSON first and fall back to YAML.
             status_yaml = json.loads(text)
         except ValueError:
-            status_yaml = yaml.safe_load(text)
+            status_yaml = safe_load(text)
         return cls(status_yaml, text)
 
     @property
@@ -1,13 +1,15 @@
 import os
+import re
+import subprocess
 
 from datetime import (
     datetime,
     timedelta,
     )
 try:
-    from mock import patch
-except ImportError:
     from unittest.mock import patch
+except ImportError:
+    from mock import patch
 
 from jujupy.backend import (
     JUJU_DEV_FEATURE_FLAGS,
@@ -28,10 +30,34 @@ from tests import (
     )
 
 
+DEADLINE = datetime(2015, 1, 2, 3, 4, 5)
+AFTER_DEADLINE = DEADLINE + timedelta(seconds=1)
+DEADLINE_RE = re.compile('Operation exceeded deadline.')
+
+# debug and model settings, with the full_args they give for 'help commands'.
+FULL_ARGS_CASES = (
+    (False, None, ('juju', '--show-log', 'help', 'commands')),
+    (True, None, ('juju', '--debug', 'help', 'commands')),
+    (False, 'test', ('juju', '--show-log', 'help', '-m', 'test', 'commands')),
+    )
+
+
 class TestJujuBackend(TestCase):
 
     test_environ = {'PATH': 'foo:bar'}
 
+    def patch_popen(self, output=b''):
+        """Patch subprocess.Popen for the rest of the test.
+
+        The fake process succeeds, writing output to stdout. Returns the
+        Popen mock."""
+        popen_mock = self.addContext(patch.object(subprocess, 'Popen'))
+        proc = popen_mock.return_value
+        proc.returncode = 0
+        proc.wait.return_value = 0
+        proc.communicate.return_value = (output, b'')
+        return popen_mock
+
     def test_juju2_backend(self):
         backend = JujuBackend('/bin/path', '2.0', set(), False)
         self.assertEqual('/bin/path', backend.full_path)
@@ -53,44 +79,39 @@ class TestJujuBackend(TestCase):
             full_path=None, version=None, debug=None, feature_flags=None)
         self.assertIs(cloned.juju_timings, backend.juju_timings)
 
-    def test__check_timeouts(self):
+    @patch('jujupy.JujuBackend._now')
+    def test__check_timeouts(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
-            soft_deadline=datetime(2015, 1, 2, 3, 4, 5))
-        with patch('jujupy.JujuBackend._now',
-                   return_value=backend.soft_deadline):
+            soft_deadline=DEADLINE)
+        now_mock.return_value = backend.soft_deadline
+        with backend._check_timeouts():
+            pass
+        now_mock.return_value = AFTER_DEADLINE
+        with self.assertRaisesRegex(SoftDeadlineExceeded, DEADLINE_RE):
             with backend._check_timeouts():
                 pass
-        now = backend.soft_deadline + timedelta(seconds=1)
-        with patch('jujupy.JujuBackend._now', return_value=now):
-            with self.assertRaisesRegexp(
-                    SoftDeadlineExceeded,
-                    'Operation exceeded deadline.'):
-                with backend._check_timeouts():
-                    pass
-
-    def test__check_timeouts_no_deadline(self):
+
+    @patch('jujupy.JujuBackend._now', return_value=AFTER_DEADLINE)
+    def test__check_timeouts_no_deadline(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
             soft_deadline=None)
-        now = datetime(2015, 1, 2, 3, 4, 6)
-        with patch('jujupy.JujuBackend._now', return_value=now):
-            with backend._check_timeouts():
-                pass
+        with backend._check_timeouts():
+            pass
 
-    def test_ignore_soft_deadline_check_timeouts(self):
+    @patch('jujupy.JujuBackend._now')
+    def test_ignore_soft_deadline_check_timeouts(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
-            soft_deadline=datetime(2015, 1, 2, 3, 4, 5))
-        now = backend.soft_deadline + timedelta(seconds=1)
-        with patch('jujupy.JujuBackend._now', return_value=now):
-            with backend.ignore_soft_deadline():
-                with backend._check_timeouts():
-                    pass
-            with self.assertRaisesRegexp(SoftDeadlineExceeded,
-                                         'Operation exceeded deadline.'):
-                with backend._check_timeouts():
-                    pass
+            soft_deadline=DEADLINE)
+        now_mock.return_value = AFTER_DEADLINE
+        with backend.ignore_soft_deadline():
+            with backend._check_timeouts():
+                pass
+        with self.assertRaisesRegex(SoftDeadlineExceeded, DEADLINE_RE):
+            with backend._check_timeouts():
+                pass
 
     def test_shell_environ_feature_flags(self):
         backend = JujuBackend(
@@ -119,20 +140,10 @@ class TestJujuBackend(TestCase):
         self.assertEqual('june,run-test', env[JUJU_DEV_FEATURE_FLAGS])
 
     def test_full_args(self):
-        backend = JujuBackend('/bin/path/juju', '2.0', set(), False, None)
-        full = backend.full_args('help', ('commands',), None, None)
-        self.assertEqual(('juju', '--show-log', 'help', 'commands'), full)
-
-    def test_full_args_debug(self):
-        backend = JujuBackend('/bin/path/juju', '2.0', set(), True, None)
-        full = backend.full_args('help', ('commands',), None, None)
-        self.assertEqual(('juju', '--debug', 'help', 'commands'), full)
-
-    def test_full_args_model(self):
-        backend = JujuBackend('/bin/path/juju', '2.0', set(), False, None)
-        full = backend.full_args('help', ('commands',), 'test', None)
-        self.assertEqual(('juju', '--show-log', 'help', '-m', 'test',
-                          'commands'), full)
+        for debug, model, expected in FULL_ARGS_CASES:
+            backend = JujuBackend('/bin/path/juju', '2.0', set(), debug, None)
+            full = backend.full_args('help', ('commands',), model, None)
+            self.assertEqual(expected, full, (debug, model))
 
     def test_full_args_timeout(self):
         backend = JujuBackend('/bin/path/juju', '2.0', set(), False, None)
@@ -140,69 +151,58 @@ class TestJujuBackend(TestCase):
         self.assertEqual(get_timeout_prefix(600, backend._timeout_path) +
                          ('juju', '--show-log', 'help', 'commands'), full)
 
-    def test_juju_checks_timeouts(self):
+    @patch('jujupy.JujuBackend._now')
+    def test_juju_checks_timeouts(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
-            soft_deadline=datetime(2015, 1, 2, 3, 4, 5))
-        with patch('subprocess.check_call'):
-            with patch('jujupy.JujuBackend._now',
-                       return_value=backend.soft_deadline):
-                backend.juju('cmd', ('args',), [], 'home')
-            now = backend.soft_deadline + timedelta(seconds=1)
-            with patch('jujupy.JujuBackend._now', return_value=now):
-                with self.assertRaisesRegexp(SoftDeadlineExceeded,
-                                             'Operation exceeded deadline.'):
-                    backend.juju('cmd', ('args',), [], 'home')
-
-    def test_juju_async_checks_timeouts(self):
+            soft_deadline=DEADLINE)
+        self.addContext(patch.object(subprocess, 'check_call'))
+        now_mock.return_value = backend.soft_deadline
+        backend.juju('cmd', ('args',), [], 'home')
+        now_mock.return_value = AFTER_DEADLINE
+        with self.assertRaisesRegex(SoftDeadlineExceeded, DEADLINE_RE):
+            backend.juju('cmd', ('args',), [], 'home')
+
+    @patch('jujupy.JujuBackend._now')
+    def test_juju_async_checks_timeouts(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
-            soft_deadline=datetime(2015, 1, 2, 3, 4, 5))
-        with patch('subprocess.Popen') as mock_popen:
-            mock_popen.return_value.wait.return_value = 0
-            with patch('jujupy.JujuBackend._now',
-                       return_value=backend.soft_deadline):
-                with backend.juju_async('cmd', ('args',), [], 'home'):
-                    pass
-            now = backend.soft_deadline + timedelta(seconds=1)
-            with patch('jujupy.JujuBackend._now', return_value=now):
-                with self.assertRaisesRegexp(SoftDeadlineExceeded,
-                                             'Operation exceeded deadline.'):
-                    with backend.juju_async('cmd', ('args',), [], 'home'):
-                        pass
-
-    def test_get_juju_output_checks_timeouts(self):
+            soft_deadline=DEADLINE)
+        self.patch_popen()
+        now_mock.return_value = backend.soft_deadline
+        with backend.juju_async('cmd', ('args',), [], 'home'):
+            pass
+        now_mock.return_value = AFTER_DEADLINE
+        with self.assertRaisesRegex(SoftDeadlineExceeded, DEADLINE_RE):
+            with backend.juju_async('cmd', ('args',), [], 'home'):
+                pass
+
+    @patch('jujupy.JujuBackend._now')
+    def test_get_juju_output_checks_timeouts(self, now_mock):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
-            soft_deadline=datetime(2015, 1, 2, 3, 4, 5))
-        with patch('subprocess.Popen') as mock_popen:
-            mock_popen.return_value.returncode = 0
-            mock_popen.return_value.communicate.return_value = ('', '')
-            with patch('jujupy.JujuBackend._now',
-                       return_value=backend.soft_deadline):
-                backend.get_juju_output('cmd', ('args',), [], 'home')
-            now = backend.soft_deadline + timedelta(seconds=1)
-            with patch('jujupy.JujuBackend._now', return_value=now):
-                with self.assertRaisesRegexp(SoftDeadlineExceeded,
-                                             'Operation exceeded deadline.'):
-                    backend.get_juju_output('cmd', ('args',), [], 'home')
+            soft_deadline=DEADLINE)
+        self.patch_popen()
+        now_mock.return_value = backend.soft_deadline
+        backend.get_juju_output('cmd', ('args',), [], 'home')
+        now_mock.return_value = AFTER_DEADLINE
+        with self.assertRaisesRegex(SoftDeadlineExceeded, DEADLINE_RE):
+            backend.get_juju_output('cmd', ('args',), [], 'home')
 
     def test_get_active_model(self):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
             soft_deadline=None)
-        with patch('subprocess.Popen') as mock_popen:
-            mock_popen.return_value.communicate.return_value = (
-                b'{"current-model": "model"}', b'')
-            mock_popen.return_value.returncode = 0
-            result = backend.get_active_model('/foo/bar')
+        self.patch_popen(b'{"current-model": "model"}')
+        result = backend.get_active_model('/foo/bar')
         self.assertEqual(('model'), result)
 
     def test_get_active_model_none(self):
         backend = JujuBackend(
             '/bin/path', '2.0', set(), debug=False,
             soft_deadline=None)
-        with patch('subprocess.Popen', autospec=True, return_value=FakePopen(
-                   '{"models": {}}', '', 0)):
-            with self.assertRaises(NoActiveModel):
-                backend.get_active_model('/foo/bar')
+        self.addContext(patch.object(
+            subprocess, 'Popen', return_value=FakePopen(
+                '{"models": {}}', '', 0)))
+        with self.assertRaises(NoActiveModel):
+            backend.get_active_model('/foo/bar')
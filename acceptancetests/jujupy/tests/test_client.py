@@ -7,6 +7,7 @@ from datetime import (
 import json
 import logging
 import os
+import re
 import socket
 try:
     from StringIO import StringIO
@@ -17,18 +18,21 @@ import sys
 from textwrap import dedent
 
 try:
-    from mock import (
+    from unittest.mock import (
         call,
+        create_autospec,
+        DEFAULT,
         Mock,
         patch,
     )
 except ImportError:
-    from unittest.mock import (
+    from mock import (
         call,
+        create_autospec,
+        DEFAULT,
         Mock,
         patch,
     )
-import yaml
 
 from jujupy.configuration import (
     get_bootstrap_config_path,
@@ -52,6 +56,7 @@ from jujupy.exceptions import (
     UnitError,
 )
 from jujupy.client import (
+    client_from_config,
     Controller,
     describe_substrate,
     GroupReporter,
@@ -94,6 +99,8 @@ from tests import (
 from jujupy.utility import (
     get_timeout_path,
     JujuResourceTimeout,
+    safe_dump,
+    safe_load,
     scoped_environ,
     temp_dir,
     )
@@ -138,14 +145,27 @@ class TestErroredUnit(TestCase):
 
 class ClientTest(FakeHomeTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super(ClientTest, cls).setUpClass()
+        # Patched once per class rather than per test; setUp resets the mocks.
+        cls._pause_patcher = patch('jujupy.client.pause')
+        cls._backend_pause_patcher = patch('jujupy.backend.pause')
+        cls.pause_mock = cls._pause_patcher.start()
+        cls.backend_pause_mock = cls._backend_pause_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._backend_pause_patcher.stop()
+        cls._pause_patcher.stop()
+        super(ClientTest, cls).tearDownClass()
+
     def setUp(self):
         super(ClientTest, self).setUp()
-        patcher = patch('jujupy.client.pause')
-        backend_patcher = patch('jujupy.backend.pause')
-        self.addCleanup(patcher.stop)
-        self.addCleanup(backend_patcher.stop)
-        self.pause_mock = patcher.start()
-        backend_patcher.start()
+        self.sleep_mock = self.addContext(patch('jujupy.client.time.sleep'))
+        # Clear anything a test configured as well as the recorded calls.
+        self.pause_mock.reset_mock(return_value=True, side_effect=True)
+        self.backend_pause_mock.reset_mock(return_value=True, side_effect=True)
 
 
 class TestTempYamlFile(TestCase):
@@ -153,7 +173,8 @@ class TestTempYamlFile(TestCase):
     def test_temp_yaml_file(self):
         with temp_yaml_file({'foo': 'bar'}) as yaml_file:
             with open(yaml_file) as f:
-                self.assertEqual({'foo': 'bar'}, yaml.safe_load(f))
+                self.assertEqual({'foo': 'bar'}, safe_load(f))
+        self.assertFalse(os.path.exists(yaml_file))
 
 
 def backend_call(client, cmd, args, model=None, check=True, timeout=None,
@@ -179,12 +200,625 @@ def make_resource_list(service_app_id='applicationId'):
             'description': 'foo resource.'}}]}
 
 
+# Config given to test__bootstrap_config, and the subset it should keep.
+_BOOTSTRAP_CONFIG = {
+    'access-key': 'foo',
+    'admin-secret': 'foo',
+    'agent-stream': 'foo',
+    'application-id': 'foo',
+    'application-password': 'foo',
+    'auth-url': 'foo',
+    'authorized-keys': 'foo',
+    'availability-sets-enabled': 'foo',
+    'bootstrap-host': 'foo',
+    'bootstrap-timeout': 'foo',
+    'bootstrap-user': 'foo',
+    'client-email': 'foo',
+    'client-id': 'foo',
+    'container': 'foo',
+    'control-bucket': 'foo',
+    'default-series': 'foo',
+    'development': False,
+    'enable-os-upgrade': 'foo',
+    'host': 'foo',
+    'image-metadata-url': 'foo',
+    'location': 'foo',
+    'maas-oauth': 'foo',
+    'maas-server': 'foo',
+    'manta-key-id': 'foo',
+    'manta-user': 'foo',
+    'management-subscription-id': 'foo',
+    'management-certificate': 'foo',
+    'name': 'foo',
+    'password': 'foo',
+    'prefer-ipv6': 'foo',
+    'private-key': 'foo',
+    'region': 'foo',
+    'sdc-key-id': 'foo',
+    'sdc-url': 'foo',
+    'sdc-user': 'foo',
+    'secret-key': 'foo',
+    'storage-account-name': 'foo',
+    'subscription-id': 'foo',
+    'tenant-id': 'foo',
+    'tenant-name': 'foo',
+    'test-mode': False,
+    'tools-metadata-url': 'steve',
+    'type': 'foo',
+    'username': 'foo',
+    }
+
+
+_EXPECTED_BOOTSTRAP_CONFIG = {
+    'agent-metadata-url': 'steve',
+    'agent-stream': 'foo',
+    'authorized-keys': 'foo',
+    'availability-sets-enabled': 'foo',
+    'bootstrap-timeout': 'foo',
+    'bootstrap-user': 'foo',
+    'container': 'foo',
+    'default-series': 'foo',
+    'development': False,
+    'enable-os-upgrade': 'foo',
+    'image-metadata-url': 'foo',
+    'prefer-ipv6': 'foo',
+    'test-mode': True,
+    }
+
+
+# Status output returned by the fake get_juju_output in test_get_status.
+_STATUS_ABC = dedent("""\
+    - a
+    - b
+    - c
+    """).encode('ascii')
+
+# Filled in by TestModelClient.make_status_yaml; {0} is the status key.
+_STATUS_YAML_TEMPLATE = dedent("""\
+    model:
+      name: foo
+    machines:
+      "0":
+        {0}: {1}
+    applications:
+      jenkins:
+        units:
+          jenkins/0:
+            {0}: {2}
+    """)
+
+# Status where every subordinate agent has started.
+_SUBORDINATES_YAML = dedent("""\
+    machines:
+      "0":
+        agent-state: started
+    services:
+      jenkins:
+        units:
+          jenkins/0:
+            subordinates:
+              sub1/0:
+                agent-state: started
+      ubuntu:
+        units:
+          ubuntu/0:
+            subordinates:
+              sub2/0:
+                agent-state: started
+              sub3/0:
+                agent-state: started
+    """).encode('ascii')
+
+# Like _SUBORDINATES_YAML, but using agent-status instead of agent-state.
+_SUBORDINATES_AGENT_STATUS_YAML = dedent("""\
+    machines:
+      "0":
+        agent-state: started
+    services:
+      jenkins:
+        units:
+          jenkins/0:
+            subordinates:
+              sub1/0:
+                agent-status:
+                  current: idle
+      ubuntu:
+        units:
+          ubuntu/0:
+            subordinates:
+              sub2/0:
+                agent-status:
+                  current: idle
+              sub3/0:
+                agent-status:
+                  current: idle
+    """).encode('ascii')
+
+# Status with a subordinate on each of two ubuntu units.
+_MULTIPLE_SUBORDINATES_YAML = dedent("""\
+    machines:
+      "0":
+        agent-state: started
+    services:
+      ubuntu:
+        units:
+          ubuntu/0:
+            subordinates:
+              sub/0:
+                agent-state: started
+          ubuntu/1:
+            subordinates:
+              sub/1:
+                agent-state: started
+    """).encode('ascii')
+
+# Status whose subordinate is named without a unit number.
+_SUBORDINATE_NO_SLASH_YAML = dedent("""\
+    machines:
+      "0":
+        agent-state: started
+    applications:
+      jenkins:
+        units:
+          jenkins/0:
+            subordinates:
+              sub1:
+                agent-state: started
+    """).encode('ascii')
+
+# Status with no subordinates at all.
+_NO_SUBORDINATE_YAML = dedent("""\
+    machines:
+      "0":
+        agent-state: started
+    applications:
+      jenkins:
+        units:
+          jenkins/0:
+            agent-state: started
+    """).encode('ascii')
+
+
+def _ha_status(voting):
+    return {'machines': {
+        '0': {'controller-member-status': voting},
+        '1': {'controller-member-status': voting},
+        '2': {'controller-member-status': voting},
+        }}
+
+
+_HA_STATUS_YAML = safe_dump(_ha_status('has-vote')).encode('ascii')
+_HA_STATUS_NO_VOTE_YAML = safe_dump(_ha_status('no-vote')).encode('ascii')
+
+_HA_TWO_VOTERS_YAML = safe_dump({
+    'machines': {
+        '0': {'controller-member-status': 'has-vote'},
+        '1': {'controller-member-status': 'has-vote'},
+    },
+    'services': {},
+}).encode('ascii')
+_HA_MACHINE_ERROR_YAML = safe_dump({
+    'machines': {
+        '0': {'agent-state-info': 'running'},
+        '1': {'agent-state-info': 'error: foo'},
+    },
+    'services': {},
+}).encode('ascii')
+
+
+def _deployed_status():
+    """Return a status with a deployed jenkins unit."""
+    return {
+        'machines': {
+            '0': {'agent-state': 'started'},
+        },
+        'applications': {
+            'jenkins': {
+                'units': {
+                    'jenkins/1': {'baz': 'qux'}
+                }
+            }
+        }
+    }
+
+
+_DEPLOYED_STATUS_YAML = safe_dump(_deployed_status()).encode('ascii')
+_NOT_DEPLOYED_STATUS_YAML = safe_dump({
+    'machines': {
+        '0': {'agent-state': 'started'},
+    },
+    'applications': {},
+}).encode('ascii')
+_MACHINE_0_YAML = safe_dump({
+    'machines': {
+        '0': {'agent-state': 'started'},
+    },
+}).encode('ascii')
+_MACHINES_0_1_YAML = safe_dump({
+    'machines': {
+        '0': {'agent-state': 'started'},
+        '1': {'agent-state': 'started'},
+    },
+}).encode('ascii')
+
+# Errors expected by several of the wait_for and backup tests.
+_AGENTS_START_RE = re.compile('Timed out waiting for agents to start in lxd')
+_VOTING_RE = re.compile('Timed out waiting for voting to be enabled.')
+_NO_BACKUP_FILE_RE = re.compile('The backup file was not found in output')
+
+# The clock frozen_clock stops at, and a start time long before it, so
+# wait_for_* calls given that start time time out on their first check.
+_FAKE_NOW = datetime(2017, 1, 1)
+_FAKE_START = _FAKE_NOW - timedelta(days=1200)
+
+# Keyword arguments to ModelClient.bootstrap, with the arguments they add
+# before --constraints and after --default-model.
+_BOOTSTRAP_OPTION_CASES = (
+    ({'upload_tools': True}, ('--upload-tools',), ()),
+    ({'credential': 'credential_name'}, (),
+     ('--agent-version', '2.0', '--credential', 'credential_name')),
+    ({'bootstrap_series': 'angsty'}, (),
+     ('--agent-version', '2.0', '--bootstrap-series', 'angsty')),
+    ({'auto_upgrade': True}, (), ('--agent-version', '2.0', '--auto-upgrade')),
+    ({'no_gui': True}, (), ('--agent-version', '2.0', '--no-gui')),
+    ({'metadata_source': '/var/test-source'}, (),
+     ('--agent-version', '2.0', '--metadata-source', '/var/test-source')),
+    )
+
+# The same for bootstrap_async, which takes fewer options.
+_BOOTSTRAP_ASYNC_CASES = (
+    ({}, (), ('--agent-version', '2.0')),
+    ({'upload_tools': True}, ('--upload-tools',), ()),
+    )
+
+
+def bootstrap_args(config_name, leading=(),
+                   trailing=('--agent-version', '2.0')):
+    """Return the bootstrap arguments for env 'foo' on cloud bar/baz."""
+    return leading + (
+        '--constraints', 'mem=2G', 'bar/baz', 'foo',
+        '--config', config_name, '--default-model', 'foo') + trailing
+
+
+# Provider types and upgrade_juju keyword arguments, with the arguments
+# _upgrade_juju should get.
+_UPGRADE_JUJU_CASES = (
+    ('nonlocal', {}, ('--agent-version', '2.0')),
+    ('lxd', {'force_version': False}, ()),
+    )
+
+# Provider types and the teardown timeout juju commands should get for them.
+_TEARDOWN_TIMEOUT_CASES = (('ec2', 600), ('azure', 2700), ('gce', 1200))
+
+# destroy_controller keyword arguments, with the juju arguments they add.
+_DESTROY_CONTROLLER_CASES = (
+    ({}, ()),
+    ({'all_models': True}, ('--destroy-all-models',)),
+    )
+
+# Charm and keyword arguments to ModelClient.deploy, with the juju deploy
+# arguments they should produce.
+_DEPLOY_CASES = (
+    ('mondogb', {}, ('mondogb',)),
+    ('/home/jrandom/repo/mongodb', {}, ('/home/jrandom/repo/mongodb',)),
+    ('mondogb', {'to': '0'}, ('mondogb', '--to', '0')),
+    ('local:mondogb', {'service': 'my-mondogb'},
+     ('local:mondogb', 'my-mondogb')),
+    ('local:mondogb', {'force': True}, ('local:mondogb', '--force')),
+    ('local:blah', {'series': 'xenial'}, ('local:blah', '--series', 'xenial')),
+    ('local:blah', {'series': 'bionic'}, ('local:blah', '--series', 'bionic')),
+    ('local:blah', {'num': 2}, ('local:blah', '-n', '2')),
+    ('local:blah', {'resource': 'foo=/path/dir'},
+     ('local:blah', '--resource', 'foo=/path/dir')),
+    ('mondogb', {'storage': 'rootfs,1G'},
+     ('mondogb', '--storage', 'rootfs,1G')),
+    ('mondogb', {'constraints': 'virt-type=kvm'},
+     ('mondogb', '--constraints', 'virt-type=kvm')),
+    ('mydb', {'bind': 'backspace'}, ('mydb', '--bind', 'backspace')),
+    ('local:blah', {'alias': 'blah-blah'}, ('local:blah', 'blah-blah')),
+    )
+
+
+# Versions client_from_config is exercised with by test_from_config.
+_FROM_CONFIG_VERSIONS = (
+    '2.0.0', '2.0-beta1', '2.0-rc3', '2.1.2', '2.2-rc1', '2.3-alpha1',
+    '2.4.7', '2.5-beta2')
+
+# The juju invocation get_juju_output builds for command 'bar' on 'foo'.
+_JUJU_BASE = ('juju', '--show-log')
+_FOO_MODEL = ('-m', 'foo:foo')
+_JUJU_BAR = _JUJU_BASE + ('bar',) + _FOO_MODEL
+_ADD_MACHINE = _JUJU_BASE + ('add-machine',) + _FOO_MODEL
+
+
+def _add_ssh_machine_calls(*hosts):
+    """Return the check_call calls add_ssh_machines makes for hosts."""
+    return [call(_ADD_MACHINE + ('ssh:' + host,), stderr=None)
+            for host in hosts]
+
+
+# Whether each add-machine call succeeds, the check_call calls
+# add_ssh_machines should make, whether it raises, and how many times it
+# pauses to retry.
+_ADD_SSH_MACHINES_CASES = (
+    ((True, True, True), _add_ssh_machine_calls('m-foo', 'm-bar', 'm-baz'),
+     False, 0),
+    ((False, True, True, True),
+     _add_ssh_machine_calls('m-foo', 'm-foo', 'm-bar', 'm-baz'), False, 1),
+    ((True, False), _add_ssh_machine_calls('m-foo', 'm-bar'), True, 0),
+    ((False, False), _add_ssh_machine_calls('m-foo', 'm-foo'), True, 1),
+    )
+
+_MODEL_UUID = '9ed1bde9-45c6-4d41-851d-33fdba7fa194'
+_CONTROLLER_UUID = 'eb67e1eb-6c54-45f5-8b6a-b6243be97202'
+_CONTROLLER_MODEL_UUID = '1c908e10-4f07-459a-8419-bb61553a4660'
+
+_SHOW_MODEL_FOO = dedent("""\
+    foo:
+      name: foo
+      model-uuid: {model}
+      controller-uuid: {controller}
+      owner: admin
+      cloud: lxd
+      region: localhost
+      type: lxd
+      life: alive
+      status:
+        current: available
+        since: 1 minute ago
+      users:
+        admin:
+          display-name: admin
+          access: admin
+          last-connection: just now
+    """).format(model=_MODEL_UUID, controller=_CONTROLLER_UUID)
+
+_SHOW_MODEL_CONTROLLER = dedent("""\
+    controller:
+      name: controller
+      model-uuid: {model}
+      controller-uuid: {controller}
+      controller-name: localtempveebers
+      owner: admin
+      cloud: lxd
+      region: localhost
+      type: lxd
+      life: alive
+      status:
+        current: available
+        since: 59 seconds ago
+      users:
+        admin:
+          display-name: admin
+          access: admin
+          last-connection: just now
+    """).format(model=_CONTROLLER_MODEL_UUID, controller=_CONTROLLER_UUID)
+
+_SHOW_CONTROLLER_FOO = dedent("""\
+    foo:
+      details:
+        uuid: {uuid}
+        api-endpoints: ['10.194.140.213:17070']
+        cloud: lxd
+        region: localhost
+      models:
+        controller:
+          uuid: {uuid}
+        default:
+          uuid: 772cdd39-b454-4bd5-8704-dc9aa9ff1750
+      current-model: default
+      account:
+        user: admin
+      bootstrap-config:
+        config:
+        cloud: lxd
+        cloud-type: lxd
+        region: localhost
+    """).format(uuid=_CONTROLLER_UUID)
+
+# show-model output for a migrating model; {0} is the model name.
+_SHOW_MODEL_MIGRATING = dedent("""\
+    {0}:
+        status:
+            current: available
+            since: 4 minutes ago
+            migration: 'Some message.'
+            migration-start: 48 seconds ago
+    """)
+
+# ModelClient methods that parse get_juju_output, the output they are given,
+# what they should return and the arguments get_juju_output should get.
+_OUTPUT_LOOKUP_CASES = (
+    ('get_model_uuid', _SHOW_MODEL_FOO, _MODEL_UUID,
+     ('show-model', '--format', 'yaml', 'foo:foo')),
+    ('get_controller_model_uuid', _SHOW_MODEL_CONTROLLER,
+     _CONTROLLER_MODEL_UUID,
+     ('show-model', 'controller', '--format', 'yaml')),
+    ('get_controller_uuid', _SHOW_CONTROLLER_FOO, _CONTROLLER_UUID,
+     ('show-controller', 'foo', '--format', 'yaml')),
+    ('get_controller_endpoint', dedent("""\
+        foo:
+          details:
+            api-endpoints: ['10.0.0.1:17070', '10.0.0.2:17070']
+        """), ('10.0.0.1', '17070'), ('show-controller', 'foo')),
+    ('get_controller_endpoint', dedent("""\
+        foo:
+          details:
+            api-endpoints: ['[::1]:17070', '[fe80::216:3eff:0:9dc7]:17070']
+        """), ('::1', '17070'), ('show-controller', 'foo')),
+    )
+
+_REGISTER_OUTPUT = dedent("""\
+    User "x" added
+    User "x" granted read access to model "y"
+    Please send this command to x:
+        juju register AaBbCc""")
+
+_SHOW_MACHINE_YAML = dedent("""\
+    machines:
+      "0":
+        series: bionic
+    """)
+
+_DISABLED_COMMANDS_YAML = dedent("""\
+    - command-set: destroy-model
+      message: Lock Models
+    - command-set: remove-object""")
+
+# (model, permissions) for add_user_perms; None means use the default.
+_ADD_USER_PERMS_CASES = (
+    (None, None),
+    ('foo', None),
+    ('foo', 'write'),
+    (None, 'write'),
+    )
+
+# Application config for the get_config and get_service_config tests.
+_CONFIG = {
+    'charm': 'foo',
+    'service': 'foo',
+    'settings': {
+        'dir': {
+            'default': 'true',
+            'description': 'bla bla',
+            'type': 'string',
+            'value': '/tmp/charm-dir',
+        }
+    }
+}
+_CONFIG_YAML = safe_dump(_CONFIG)
+
+# juju run output for the ModelClient.run tests.
+_RUN_LIST_SAMPLE = [
+    {"MachineId": "1",
+     "Stdout": "Linux\n",
+     "ReturnCode": 255,
+     "Stderr": "Permission denied (publickey,password)"}]
+_RUN_OUTPUT_SAMPLE = json.dumps(_RUN_LIST_SAMPLE)
+_RUN_OUTPUT_FAIL = json.dumps({"ReturnCode": 255})
+
+# Popen results shared between tests. communicate() only ever sets
+# returncode to the value given here, so the instances can be shared.
+_POPEN_OK = FakePopen('asdf', None, 0)
+_POPEN_STDERR_ERR = FakePopen(None, 'Hello!', 1)
+_POPEN_MERGED = FakePopen('Err on out', None, 0)
+_POPEN_EMPTY = FakePopen('', '', 0)
+_POPEN_MODEL_CONFIG = FakePopen(safe_dump({'bar': 'baz'}), None, 0)
+_POPEN_TOOLS_URL = FakePopen('https://example.org/juju/tools', None, 0)
+_POPEN_BACKUP_TGZ = FakePopen('foojuju-backup-24.tgzz', '', 0)
+_POPEN_BACKUP_TAR_GZ = FakePopen('foojuju-backup-123-456.tar.gzbar', '', 0)
+_POPEN_BACKUP_WRONG = FakePopen('mumu-backup-24.tgz', '', 0)
+
+
+class TestClientFromConfig(ClientTest):
+
+    def setUp(self):
+        super(TestClientFromConfig, self).setUp()
+        self.get_version = Mock(return_value='2.0.0')
+        self.addContext(
+            patch.object(ModelClient, 'get_version', self.get_version))
+
+    def test_from_config(self):
+        # client_from_config no longer picks a client class by version, so
+        # every version yields a ModelClient carrying that version.
+        versions = _FROM_CONFIG_VERSIONS
+        self.get_version.side_effect = versions
+        self.addContext(patch.object(JujuData, 'from_config', classmethod(
+            lambda cls, name: cls(name, {}))))
+        for version in versions:
+            client = client_from_config('foo', 'juju')
+            self.assertIs(type(client), ModelClient, version)
+            self.assertEqual(version, client.version, version)
+            self.assertEqual(os.path.abspath('juju'), client.full_path)
+            self.assertEqual('foo', client.env.environment)
+        self.assertEqual(len(versions), self.get_version.call_count)
+
+    @patch.object(JujuData, 'from_config')
+    def test_from_config_no_config(self, fc_mock):
+        client = client_from_config(None, 'juju')
+        self.get_version.assert_called_once_with('juju')
+        self.assertEqual(0, fc_mock.call_count)
+        self.assertEqual('', client.env.environment)
+        self.assertEqual({}, client.env._config)
+
+    def test_from_config_debug_and_deadline(self):
+        deadline = datetime(2015, 1, 2, 3, 4, 5)
+        client = client_from_config(
+            None, 'juju', debug=True, soft_deadline=deadline)
+        self.assertIsTrue(client.debug)
+        self.assertEqual(deadline, client._backend.soft_deadline)
+
+
 class TestModelClient(ClientTest):
 
+    @classmethod
+    def setUpClass(cls):
+        super(TestModelClient, cls).setUpClass()
+        cls._proto_client = ModelClient(
+            JujuData('foo', {}, juju_home='/foo/'), '1.27', 'full/path')
+        # Shared by tests which only check the juju command a call makes.
+        cls._lxd_client = ModelClient(
+            JujuData('foo', {'type': 'lxd'}, juju_home='/foo/'), '1.234-76',
+            None)
+        # Shared by the get_juju_output tests, which only patch Popen. As
+        # with the clients above, juju_home is explicit so the real home is
+        # never consulted.
+        cls._juju_client = ModelClient(
+            JujuData('foo', juju_home='/foo/'), None, 'juju')
+        # Autospeccing is costly, so the tear_down tests reuse these method
+        # mocks, resetting them on each use.
+        cls._client_template = create_autospec(ModelClient, instance=True)
+
+    def setUp(self):
+        super(TestModelClient, self).setUp()
+        # Tests that check GroupReporter output patch _write to append here.
+        # Without autospec the mock is not bound, so it gets only the text.
+        self.writes = []
+
+    def _make_client(self, env=None, **kwargs):
+        """Clone the prototype client, giving it a copy of the prototype env.
+
+        Keyword arguments are passed to ModelClient.clone.
+        """
+        if env is None:
+            env = self._proto_client.env.clone()
+        return self._proto_client.clone(env=env, **kwargs)
+
+    def frozen_clock(self, now=_FAKE_NOW):
+        """Patch until_timeout so its clock always reads now."""
+        return patch('jujupy.utility.until_timeout.now', return_value=now)
+
+    @contextmanager
+    def status_output(self, client, output, remaining):
+        """Patch client to show output until until_timeout runs out.
+
+        until_timeout yields remaining; the get_juju_output mock is yielded.
+        """
+        with patch('jujupy.client.until_timeout',
+                   lambda *args, **kwargs: remaining):
+            with patch.object(client, 'get_juju_output',
+                              return_value=output) as gjo_mock:
+                yield gjo_mock
+
+    def stub_popen(self, fake_popen=_POPEN_OK):
+        """Make subprocess.Popen return fake_popen for the rest of the test.
+
+        Returns the Popen mock."""
+        return self.addContext(
+            patch.object(subprocess, 'Popen', return_value=fake_popen))
+
+    @contextmanager
+    def lxd_juju_mock(self):
+        """Patch juju on the shared lxd client, yielding client and mock.
+
+        Only for tests that do not change the client or its env."""
+        with patch_juju_call(self._lxd_client) as mock_juju:
+            yield self._lxd_client, mock_juju
+
     def test_get_full_path(self):
-        with patch('subprocess.check_output',
-                   return_value=b'asdf\n') as co_mock:
-            with patch('sys.platform', 'linux2'):
+        with patch.object(subprocess, 'check_output',
+                          return_value=b'asdf\n') as co_mock:
+            with patch.object(sys, 'platform', 'linux2'):
                 path = ModelClient.get_full_path()
         co_mock.assert_called_once_with(('which', 'juju'))
         expected = u'asdf'
@@ -193,9 +827,10 @@ class TestModelClient(ClientTest):
 
     def test_get_full_path_encoding(self):
         # Test with non-ascii-compatible encoding
-        with patch('subprocess.check_output',
-                   return_value='asdf\n'.encode('EBCDIC-CP-BE')) as co_mock:
-            with patch('sys.platform', 'linux2'):
+        output = 'asdf\n'.encode('EBCDIC-CP-BE')
+        with patch.object(subprocess, 'check_output',
+                          return_value=output) as co_mock:
+            with patch.object(sys, 'platform', 'linux2'):
                 with patch('jujupy.client.getpreferredencoding',
                            return_value='EBCDIC-CP-BE'):
                     path = ModelClient.get_full_path()
@@ -206,19 +841,20 @@ class TestModelClient(ClientTest):
 
     def test_no_duplicate_env(self):
         env = JujuData('foo', {})
-        client = ModelClient(env, '1.25', 'full_path')
+        client = self._make_client(env, version='1.25')
         self.assertIs(env, client.env)
 
     def test_get_version(self):
         value = ' 5.6 \n'.encode('ascii')
-        with patch('subprocess.check_output', return_value=value) as vsn:
+        with patch.object(subprocess, 'check_output',
+                          return_value=value) as vsn:
             version = ModelClient.get_version()
         self.assertEqual('5.6', version)
         vsn.assert_called_with(('juju', '--version'))
 
     def test_get_version_path(self):
-        with patch('subprocess.check_output',
-                   return_value=' 4.3'.encode('ascii')) as vsn:
+        with patch.object(subprocess, 'check_output',
+                          return_value=' 4.3'.encode('ascii')) as vsn:
             ModelClient.get_version('foo/bar/baz')
         vsn.assert_called_once_with(('foo/bar/baz', '--version'))
 
@@ -228,23 +864,16 @@ class TestModelClient(ClientTest):
             '1.23-series-arch', None)
         self.assertEqual('1.23', client.get_matching_agent_version())
 
-    def test_upgrade_juju_nonlocal(self):
-        client = ModelClient(
-            JujuData('foo', {'type': 'nonlocal'}), '2.0-betaX', None)
-        with patch.object(client, '_upgrade_juju') as juju_mock:
-            client.upgrade_juju()
-        juju_mock.assert_called_with(('--agent-version', '2.0'))
-
-    def test_upgrade_juju_no_force_version(self):
-        client = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '2.0-betaX', None)
-        with patch.object(client, '_upgrade_juju') as juju_mock:
-            client.upgrade_juju(force_version=False)
-        juju_mock.assert_called_with(())
+    def test_upgrade_juju(self):
+        for provider, kwargs, expected in _UPGRADE_JUJU_CASES:
+            client = ModelClient(
+                JujuData('foo', {'type': provider}), '2.0-betaX', None)
+            with patch.object(client, '_upgrade_juju') as juju_mock:
+                client.upgrade_juju(**kwargs)
+            self.assertEqual(call(expected), juju_mock.call_args, provider)
 
     def test_clone_unchanged(self):
-        client1 = ModelClient(JujuData('foo'), '1.27', 'full/path',
-                              debug=True)
+        client1 = self._make_client(debug=True)
         client2 = client1.clone()
         self.assertIsNot(client1, client2)
         self.assertIs(type(client1), type(client2))
@@ -256,8 +885,7 @@ class TestModelClient(ClientTest):
         self.assertEqual(client1._backend, client2._backend)
 
     def test_get_cache_path(self):
-        client = ModelClient(JujuData('foo', juju_home='/foo/'),
-                             '1.27', 'full/path', debug=True)
+        client = self._make_client(debug=True)
         self.assertEqual('/foo/models/cache.yaml',
                          client.get_cache_path())
 
@@ -274,70 +902,12 @@ class TestModelClient(ClientTest):
             }, client.make_model_config())
 
     def test__bootstrap_config(self):
-        env = JujuData('foo', {
-            'access-key': 'foo',
-            'admin-secret': 'foo',
-            'agent-stream': 'foo',
-            'application-id': 'foo',
-            'application-password': 'foo',
-            'auth-url': 'foo',
-            'authorized-keys': 'foo',
-            'availability-sets-enabled': 'foo',
-            'bootstrap-host': 'foo',
-            'bootstrap-timeout': 'foo',
-            'bootstrap-user': 'foo',
-            'client-email': 'foo',
-            'client-id': 'foo',
-            'container': 'foo',
-            'control-bucket': 'foo',
-            'default-series': 'foo',
-            'development': False,
-            'enable-os-upgrade': 'foo',
-            'host': 'foo',
-            'image-metadata-url': 'foo',
-            'location': 'foo',
-            'maas-oauth': 'foo',
-            'maas-server': 'foo',
-            'manta-key-id': 'foo',
-            'manta-user': 'foo',
-            'management-subscription-id': 'foo',
-            'management-certificate': 'foo',
-            'name': 'foo',
-            'password': 'foo',
-            'prefer-ipv6': 'foo',
-            'private-key': 'foo',
-            'region': 'foo',
-            'sdc-key-id': 'foo',
-            'sdc-url': 'foo',
-            'sdc-user': 'foo',
-            'secret-key': 'foo',
-            'storage-account-name': 'foo',
-            'subscription-id': 'foo',
-            'tenant-id': 'foo',
-            'tenant-name': 'foo',
-            'test-mode': False,
-            'tools-metadata-url': 'steve',
-            'type': 'foo',
-            'username': 'foo',
-            }, 'home')
+        env = JujuData('foo', dict(_BOOTSTRAP_CONFIG), 'home')
         client = ModelClient(env, None, 'my/juju/bin')
         with client._bootstrap_config() as config_filename:
             with open(config_filename) as f:
-                self.assertEqual({
-                    'agent-metadata-url': 'steve',
-                    'agent-stream': 'foo',
-                    'authorized-keys': 'foo',
-                    'availability-sets-enabled': 'foo',
-                    'bootstrap-timeout': 'foo',
-                    'bootstrap-user': 'foo',
-                    'container': 'foo',
-                    'default-series': 'foo',
-                    'development': False,
-                    'enable-os-upgrade': 'foo',
-                    'image-metadata-url': 'foo',
-                    'prefer-ipv6': 'foo',
-                    'test-mode': True,
-                    }, yaml.safe_load(f))
+                self.assertEqual(_EXPECTED_BOOTSTRAP_CONFIG,
+                                 safe_load(f))
 
     def test_get_cloud_region(self):
         self.assertEqual(
@@ -347,52 +917,52 @@ class TestModelClient(ClientTest):
 
     def test_bootstrap_maas(self):
         env = JujuData('maas', {'type': 'foo', 'region': 'asdf'})
-        with patch_juju_call(ModelClient) as mock:
-            client = ModelClient(env, '2.0-zeta1', None)
-            with patch.object(client.env, 'maas', lambda: True):
-                with observable_temp_file() as config_file:
-                    client.bootstrap()
-            mock.assert_called_with(
-                'bootstrap', (
-                    '--constraints', 'mem=2G spaces=^endpoint-bindings-data,'
-                    '^endpoint-bindings-public',
-                    'foo/asdf', 'maas',
-                    '--config', config_file.name, '--default-model', 'maas',
-                    '--agent-version', '2.0'),
-                include_e=False)
+        mock = self.addContext(patch_juju_call(ModelClient))
+        client = ModelClient(env, '2.0-zeta1', None)
+        self.addContext(patch.object(client.env, 'maas', lambda: True))
+        config_file = self.addContext(observable_temp_file())
+        client.bootstrap()
+        mock.assert_called_with(
+            'bootstrap', (
+                '--constraints', 'mem=2G spaces=^endpoint-bindings-data,'
+                '^endpoint-bindings-public',
+                'foo/asdf', 'maas',
+                '--config', config_file.name, '--default-model', 'maas',
+                '--agent-version', '2.0'),
+            include_e=False)
 
     def test_bootstrap_maas_spaceless(self):
         # Disable space constraint with environment variable
         os.environ['JUJU_CI_SPACELESSNESS'] = "1"
         env = JujuData('maas', {'type': 'foo', 'region': 'asdf'})
-        with patch_juju_call(ModelClient) as mock:
-            client = ModelClient(env, '2.0-zeta1', None)
-            with patch.object(client.env, 'maas', lambda: True):
-                with observable_temp_file() as config_file:
-                    client.bootstrap()
-            mock.assert_called_with(
-                'bootstrap', (
-                    '--constraints', 'mem=2G',
-                    'foo/asdf', 'maas',
-                    '--config', config_file.name, '--default-model', 'maas',
-                    '--agent-version', '2.0'),
-                include_e=False)
+        mock = self.addContext(patch_juju_call(ModelClient))
+        client = ModelClient(env, '2.0-zeta1', None)
+        self.addContext(patch.object(client.env, 'maas', lambda: True))
+        config_file = self.addContext(observable_temp_file())
+        client.bootstrap()
+        mock.assert_called_with(
+            'bootstrap', (
+                '--constraints', 'mem=2G',
+                'foo/asdf', 'maas',
+                '--config', config_file.name, '--default-model', 'maas',
+                '--agent-version', '2.0'),
+            include_e=False)
 
     def test_bootstrap_joyent(self):
         env = JujuData('joyent', {
             'type': 'joyent', 'sdc-url': 'https://foo.api.joyentcloud.com'})
         client = ModelClient(env, '2.0-zeta1', None)
-        with patch_juju_call(client) as mock:
-            with patch.object(client.env, 'joyent', lambda: True):
-                with observable_temp_file() as config_file:
-                    client.bootstrap()
-            mock.assert_called_once_with(
-                'bootstrap', (
-                    '--constraints', 'mem=2G cpu-cores=1',
-                    'joyent/foo', 'joyent',
-                    '--config', config_file.name,
-                    '--default-model', 'joyent', '--agent-version', '2.0',
-                    ), include_e=False)
+        mock = self.addContext(patch_juju_call(client))
+        self.addContext(patch.object(client.env, 'joyent', lambda: True))
+        config_file = self.addContext(observable_temp_file())
+        client.bootstrap()
+        mock.assert_called_once_with(
+            'bootstrap', (
+                '--constraints', 'mem=2G cpu-cores=1',
+                'joyent/foo', 'joyent',
+                '--config', config_file.name,
+                '--default-model', 'joyent', '--agent-version', '2.0',
+                ), include_e=False)
 
     def test_bootstrap(self):
         env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
@@ -401,95 +971,24 @@ class TestModelClient(ClientTest):
                 client = ModelClient(env, '2.0-zeta1', None)
                 client.bootstrap()
                 mock.assert_called_with(
-                    'bootstrap', ('--constraints', 'mem=2G',
-                                  'bar/baz', 'foo',
-                                  '--config', config_file.name,
-                                  '--default-model', 'foo',
-                                  '--agent-version', '2.0'), include_e=False)
+                    'bootstrap', bootstrap_args(config_file.name),
+                    include_e=False)
                 config_file.seek(0)
-                config = yaml.safe_load(config_file)
+                config = safe_load(config_file)
         self.assertEqual({'test-mode': True}, config)
 
-    def test_bootstrap_upload_tools(self):
-        env = JujuData('foo', {'type': 'foo', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        with observable_temp_file() as config_file:
-            with patch_juju_call(client) as mock:
-                client.bootstrap(upload_tools=True)
-        mock.assert_called_with(
-            'bootstrap', (
-                '--upload-tools', '--constraints', 'mem=2G',
-                'foo/baz', 'foo',
-                '--config', config_file.name,
-                '--default-model', 'foo'), include_e=False)
-
-    def test_bootstrap_credential(self):
-        env = JujuData('foo', {'type': 'foo', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        with observable_temp_file() as config_file:
-            with patch_juju_call(client) as mock:
-                client.bootstrap(credential='credential_name')
-        mock.assert_called_with(
-            'bootstrap', (
-                '--constraints', 'mem=2G',
-                'foo/baz', 'foo',
-                '--config', config_file.name,
-                '--default-model', 'foo', '--agent-version', '2.0',
-                '--credential', 'credential_name'), include_e=False)
-
-    def test_bootstrap_bootstrap_series(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        with patch_juju_call(client) as mock:
-            with observable_temp_file() as config_file:
-                client.bootstrap(bootstrap_series='angsty')
-        mock.assert_called_with(
-            'bootstrap', (
-                '--constraints', 'mem=2G',
-                'bar/baz', 'foo',
-                '--config', config_file.name, '--default-model', 'foo',
-                '--agent-version', '2.0',
-                '--bootstrap-series', 'angsty'), include_e=False)
-
-    def test_bootstrap_auto_upgrade(self):
+    def test_bootstrap_options(self):
         env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
         client = ModelClient(env, '2.0-zeta1', None)
-        with patch_juju_call(client) as mock:
-            with observable_temp_file() as config_file:
-                client.bootstrap(auto_upgrade=True)
-        mock.assert_called_with(
-            'bootstrap', (
-                '--constraints', 'mem=2G',
-                'bar/baz', 'foo',
-                '--config', config_file.name, '--default-model', 'foo',
-                '--agent-version', '2.0', '--auto-upgrade'), include_e=False)
-
-    def test_bootstrap_no_gui(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        with patch_juju_call(client) as mock:
-            with observable_temp_file() as config_file:
-                client.bootstrap(no_gui=True)
-        mock.assert_called_with(
-            'bootstrap', (
-                '--constraints', 'mem=2G',
-                'bar/baz', 'foo',
-                '--config', config_file.name, '--default-model', 'foo',
-                '--agent-version', '2.0', '--no-gui'), include_e=False)
-
-    def test_bootstrap_metadata(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        with patch_juju_call(client) as mock:
-            with observable_temp_file() as config_file:
-                client.bootstrap(metadata_source='/var/test-source')
-        mock.assert_called_with(
-            'bootstrap', (
-                '--constraints', 'mem=2G',
-                'bar/baz', 'foo',
-                '--config', config_file.name, '--default-model', 'foo',
-                '--agent-version', '2.0',
-                '--metadata-source', '/var/test-source'), include_e=False)
+        for kwargs, leading, trailing in _BOOTSTRAP_OPTION_CASES:
+            with patch_juju_call(client) as mock:
+                with observable_temp_file() as config_file:
+                    client.bootstrap(**kwargs)
+            self.assertEqual(
+                [call('bootstrap',
+                      bootstrap_args(config_file.name, leading, trailing),
+                      include_e=False)],
+                mock.call_args_list, kwargs)
 
     def test_get_bootstrap_args_bootstrap_to(self):
         env = JujuData(
@@ -498,9 +997,8 @@ class TestModelClient(ClientTest):
         args = client.get_bootstrap_args(
             upload_tools=False, config_filename='config')
         self.assertEqual(
-            ('--constraints', 'mem=2G', 'bar/baz', 'foo',
-             '--config', 'config', '--default-model', 'foo',
-             '--agent-version', '2.0', '--to', 'zone=fnord'),
+            bootstrap_args('config', trailing=(
+                '--agent-version', '2.0', '--to', 'zone=fnord')),
             args)
 
     def test_bootstrap_async(self):
@@ -508,57 +1006,30 @@ class TestModelClient(ClientTest):
         with patch.object(ModelClient, 'juju_async', autospec=True) as mock:
             client = ModelClient(env, '2.0-zeta1', None)
             client.env.juju_home = 'foo'
-            with observable_temp_file() as config_file:
-                with client.bootstrap_async():
-                    mock.assert_called_once_with(
-                        client, 'bootstrap', (
-                            '--constraints', 'mem=2G',
-                            'bar/baz', 'foo',
-                            '--config', config_file.name,
-                            '--default-model', 'foo',
-                            '--agent-version', '2.0'), include_e=False)
-
-    def test_bootstrap_async_upload_tools(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        with patch.object(ModelClient, 'juju_async', autospec=True) as mock:
-            client = ModelClient(env, '2.0-zeta1', None)
-            with observable_temp_file() as config_file:
-                with client.bootstrap_async(upload_tools=True):
-                    mock.assert_called_with(
-                        client, 'bootstrap', (
-                            '--upload-tools', '--constraints', 'mem=2G',
-                            'bar/baz', 'foo',
-                            '--config', config_file.name,
-                            '--default-model', 'foo',
-                            ),
-                        include_e=False)
-
-    def test_get_bootstrap_args_bootstrap_series(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        args = client.get_bootstrap_args(upload_tools=True,
-                                         config_filename='config',
-                                         bootstrap_series='angsty')
-        self.assertEqual(args, (
-            '--upload-tools', '--constraints', 'mem=2G',
-            'bar/baz', 'foo',
-            '--config', 'config', '--default-model', 'foo',
-            '--bootstrap-series', 'angsty'))
-
-    def test_get_bootstrap_args_agent_version(self):
-        env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
-        client = ModelClient(env, '2.0-zeta1', None)
-        args = client.get_bootstrap_args(upload_tools=False,
-                                         config_filename='config',
-                                         agent_version='2.0-lambda1')
-        self.assertEqual(('--constraints', 'mem=2G',
-                          'bar/baz', 'foo',
-                          '--config', 'config', '--default-model', 'foo',
-                          '--agent-version', '2.0-lambda1'), args)
-
-    def test_get_bootstrap_args_upload_tools_and_agent_version(self):
+            for kwargs, leading, trailing in _BOOTSTRAP_ASYNC_CASES:
+                mock.reset_mock()
+                with observable_temp_file() as config_file:
+                    with client.bootstrap_async(**kwargs):
+                        self.assertEqual(
+                            [call(client, 'bootstrap', bootstrap_args(
+                                config_file.name, leading, trailing),
+                                include_e=False)],
+                            mock.call_args_list, kwargs)
+
+    def test_get_bootstrap_args(self):
         env = JujuData('foo', {'type': 'bar', 'region': 'baz'})
         client = ModelClient(env, '2.0-zeta1', None)
+        for kwargs, expected in [
+                ({'upload_tools': True, 'bootstrap_series': 'angsty'},
+                 bootstrap_args('config', ('--upload-tools',),
+                                ('--bootstrap-series', 'angsty'))),
+                ({'upload_tools': False, 'agent_version': '2.0-lambda1'},
+                 bootstrap_args('config', trailing=(
+                     '--agent-version', '2.0-lambda1'))),
+                ]:
+            args = client.get_bootstrap_args(
+                config_filename='config', **kwargs)
+            self.assertEqual(expected, args, kwargs)
         with self.assertRaises(ValueError):
             client.get_bootstrap_args(upload_tools=True,
                                       config_filename='config',
@@ -603,39 +1074,26 @@ class TestModelClient(ClientTest):
             suppress_err=False)
 
     def test_destroy_model(self):
-        env = JujuData('foo', {'type': 'ec2'})
-        client = ModelClient(env, None, None)
-        with patch_juju_call(client) as mock:
-            client.destroy_model()
-        mock.assert_called_with(
-            'destroy-model', ('foo:foo', '-y', '--destroy-storage'),
-            include_e=False, timeout=600)
-
-    def test_destroy_model_azure(self):
-        env = JujuData('foo', {'type': 'azure'})
-        client = ModelClient(env, None, None)
-        with patch_juju_call(client) as mock:
-            client.destroy_model()
-        mock.assert_called_with(
-            'destroy-model', ('foo:foo', '-y', '--destroy-storage'),
-            include_e=False, timeout=2700)
-
-    def test_destroy_model_gce(self):
-        env = JujuData('foo', {'type': 'gce'})
-        client = ModelClient(env, None, None)
-        with patch_juju_call(client) as mock:
-            client.destroy_model()
-        mock.assert_called_with(
-            'destroy-model', ('foo:foo', '-y', '--destroy-storage'),
-            include_e=False, timeout=1200)
+        for provider, timeout in _TEARDOWN_TIMEOUT_CASES:
+            client = ModelClient(
+                JujuData('foo', {'type': provider}), None, None)
+            with patch_juju_call(client) as mock:
+                client.destroy_model()
+            self.assertEqual(
+                [call('destroy-model', ('foo:foo', '-y', '--destroy-storage'),
+                      include_e=False, timeout=timeout)],
+                mock.call_args_list, provider)
 
     def test_kill_controller(self):
-        client = ModelClient(JujuData('foo', {'type': 'ec2'}), None, None)
-        with patch_juju_call(client) as juju_mock:
-            client.kill_controller()
-        juju_mock.assert_called_once_with(
-            'kill-controller', ('foo', '-y'), check=False, include_e=False,
-            timeout=600)
+        for provider, timeout in _TEARDOWN_TIMEOUT_CASES:
+            client = ModelClient(
+                JujuData('foo', {'type': provider}), None, None)
+            with patch_juju_call(client) as juju_mock:
+                client.kill_controller()
+            self.assertEqual(
+                [call('kill-controller', ('foo', '-y'), check=False,
+                      include_e=False, timeout=timeout)],
+                juju_mock.call_args_list, provider)
 
     def test_kill_controller_check(self):
         client = ModelClient(JujuData('foo', {'type': 'ec2'}), None, None)
@@ -645,29 +1103,15 @@ class TestModelClient(ClientTest):
             'kill-controller', ('foo', '-y'), check=True, include_e=False,
             timeout=600)
 
-    def test_kill_controller_gce(self):
-        client = ModelClient(JujuData('foo', {'type': 'gce'}), None, None)
-        with patch_juju_call(client) as juju_mock:
-            client.kill_controller()
-        juju_mock.assert_called_once_with(
-            'kill-controller', ('foo', '-y'), check=False, include_e=False,
-            timeout=1200)
-
     def test_destroy_controller(self):
         client = ModelClient(JujuData('foo', {'type': 'ec2'}), None, None)
-        with patch_juju_call(client) as juju_mock:
-            client.destroy_controller()
-        juju_mock.assert_called_once_with(
-            'destroy-controller', ('foo', '-y'), include_e=False,
-            timeout=600)
-
-    def test_destroy_controller_all_models(self):
-        client = ModelClient(JujuData('foo', {'type': 'ec2'}), None, None)
-        with patch_juju_call(client) as juju_mock:
-            client.destroy_controller(all_models=True)
-        juju_mock.assert_called_once_with(
-            'destroy-controller', ('foo', '-y', '--destroy-all-models'),
-            include_e=False, timeout=600)
+        for kwargs, extra_args in _DESTROY_CONTROLLER_CASES:
+            with patch_juju_call(client) as juju_mock:
+                client.destroy_controller(**kwargs)
+            self.assertEqual(
+                [call('destroy-controller', ('foo', '-y') + extra_args,
+                      include_e=False, timeout=600)],
+                juju_mock.call_args_list, kwargs)
 
     @contextmanager
     def mock_tear_down(self, client, destroy_raises=False, kill_raises=False):
@@ -676,15 +1120,14 @@ class TestModelClient(ClientTest):
             def raise_error(*args, **kwargs):
                 raise subprocess.CalledProcessError(
                     1, ('juju', attribute.replace('_', '-'), '-y'))
+            mock = getattr(self._client_template, attribute)
+            mock.reset_mock(return_value=True, side_effect=True)
             if raises:
-                with patch.object(target, attribute, autospec=True,
-                                  side_effect=raise_error) as mock:
-                    yield mock
+                mock.side_effect = raise_error
             else:
-                with patch.object(
-                        target, attribute, autospec=True,
-                        return_value=make_fake_juju_return()) as mock:
-                    yield mock
+                mock.return_value = make_fake_juju_return()
+            with patch.object(target, attribute, mock):
+                yield mock
 
         with patch_raise(client, 'destroy_controller', destroy_raises
                          ) as mock_destroy:
@@ -722,67 +1165,49 @@ class TestModelClient(ClientTest):
         mock_kill.assert_called_once_with()
 
     def test_get_juju_output(self):
-        env = JujuData('foo')
-        client = ModelClient(env, None, 'juju')
-        fake_popen = FakePopen('asdf', None, 0)
-        with patch('subprocess.Popen', return_value=fake_popen) as mock:
-            result = client.get_juju_output('bar')
+        client = self._juju_client
+        mock = self.stub_popen()
+        result = client.get_juju_output('bar')
         self.assertEqual('asdf'.encode('ascii'), result)
-        self.assertEqual((('juju', '--show-log', 'bar', '-m', 'foo:foo'),),
-                         mock.call_args[0])
+        self.assertEqual((_JUJU_BAR,), mock.call_args[0])
 
     def test_get_juju_output_accepts_varargs(self):
-        env = JujuData('foo')
-        fake_popen = FakePopen('asdf', None, 0)
-        client = ModelClient(env, None, 'juju')
-        with patch('subprocess.Popen', return_value=fake_popen) as mock:
-            result = client.get_juju_output('bar', 'baz', '--qux')
+        client = self._juju_client
+        mock = self.stub_popen()
+        result = client.get_juju_output('bar', 'baz', '--qux')
         self.assertEqual('asdf'.encode('ascii'), result)
-        self.assertEqual((('juju', '--show-log', 'bar', '-m', 'foo:foo', 'baz',
-                           '--qux'),), mock.call_args[0])
+        self.assertEqual((_JUJU_BAR + ('baz', '--qux'),), mock.call_args[0])
 
     def test_get_juju_output_stderr(self):
-        env = JujuData('foo')
-        fake_popen = FakePopen(None, 'Hello!', 1)
-        client = ModelClient(env, None, 'juju')
+        client = self._juju_client
+        self.stub_popen(_POPEN_STDERR_ERR)
         with self.assertRaises(subprocess.CalledProcessError) as exc:
-            with patch('subprocess.Popen', return_value=fake_popen):
-                client.get_juju_output('bar')
+            client.get_juju_output('bar')
         self.assertEqual(exc.exception.stderr, 'Hello!'.encode('ascii'))
 
     def test_get_juju_output_merge_stderr(self):
-        env = JujuData('foo')
-        fake_popen = FakePopen('Err on out', None, 0)
-        client = ModelClient(env, None, 'juju')
-        with patch('subprocess.Popen', return_value=fake_popen) as mock_popen:
-            result = client.get_juju_output('bar', merge_stderr=True)
+        client = self._juju_client
+        mock_popen = self.stub_popen(_POPEN_MERGED)
+        result = client.get_juju_output('bar', merge_stderr=True)
         self.assertEqual(result, 'Err on out'.encode('ascii'))
         mock_popen.assert_called_once_with(
-            ('juju', '--show-log', 'bar', '-m', 'foo:foo'),
-            stdin=subprocess.PIPE, stderr=subprocess.STDOUT,
+            _JUJU_BAR, stdin=subprocess.PIPE, stderr=subprocess.STDOUT,
             stdout=subprocess.PIPE)
 
     def test_get_juju_output_full_cmd(self):
-        env = JujuData('foo')
-        fake_popen = FakePopen(None, 'Hello!', 1)
-        client = ModelClient(env, None, 'juju')
+        client = self._juju_client
+        self.stub_popen(_POPEN_STDERR_ERR)
         with self.assertRaises(subprocess.CalledProcessError) as exc:
-            with patch('subprocess.Popen', return_value=fake_popen):
-                client.get_juju_output('bar', '--baz', 'qux')
-        self.assertEqual(
-            ('juju', '--show-log', 'bar', '-m', 'foo:foo', '--baz', 'qux'),
-            exc.exception.cmd)
+            client.get_juju_output('bar', '--baz', 'qux')
+        self.assertEqual(_JUJU_BAR + ('--baz', 'qux'), exc.exception.cmd)
 
     def test_get_juju_output_accepts_timeout(self):
-        env = JujuData('foo')
-        fake_popen = FakePopen('asdf', None, 0)
-        client = ModelClient(env, None, 'juju')
-        with patch('subprocess.Popen', return_value=fake_popen) as po_mock:
-            client.get_juju_output('bar', timeout=5)
+        client = self._juju_client
+        po_mock = self.stub_popen()
+        client.get_juju_output('bar', timeout=5)
         self.assertEqual(
             po_mock.call_args[0][0],
-            (sys.executable, get_timeout_path(), '5.00', '--', 'juju',
-             '--show-log', 'bar', '-m', 'foo:foo'))
+            (sys.executable, get_timeout_path(), '5.00', '--') + _JUJU_BAR)
 
     def test__shell_environ_juju_data(self):
         client = ModelClient(
@@ -796,22 +1221,16 @@ class TestModelClient(ClientTest):
         client = ModelClient(env, None, '/foobar/bar')
 
         def check_path(*args, **kwargs):
-            self.assertRegexpMatches(os.environ['PATH'], r'/foobar\:')
+            self.assertRegex(os.environ['PATH'], r'/foobar\:')
             return FakePopen(None, None, 0)
-        with patch('subprocess.Popen', autospec=True,
-                   side_effect=check_path):
+        with patch.object(subprocess, 'Popen', side_effect=check_path):
             client.get_juju_output('cmd', 'baz')
 
     def test_get_status(self):
-        output_text = dedent("""\
-                - a
-                - b
-                - c
-                """).encode('ascii')
         env = JujuData('foo')
         client = ModelClient(env, None, None)
         with patch.object(client, 'get_juju_output',
-                          return_value=output_text) as gjo_mock:
+                          return_value=_STATUS_ABC) as gjo_mock:
             result = client.get_status()
         gjo_mock.assert_called_once_with(
             'show-status', '--format', 'yaml', controller=False)
@@ -821,32 +1240,24 @@ class TestModelClient(ClientTest):
     def test_get_status_retries_on_error(self):
         env = JujuData('foo')
         client = ModelClient(env, None, None)
-        client.attempt = 0
-
-        def get_juju_output(command, *args, **kwargs):
-            if client.attempt == 1:
-                return '"hello"'.encode('ascii')
-            client.attempt += 1
-            raise subprocess.CalledProcessError(1, command)
-
-        with patch.object(client, 'get_juju_output', get_juju_output):
-            client.get_status()
+        with patch.object(client, 'get_juju_output', side_effect=[
+                subprocess.CalledProcessError(1, 'show-status'),
+                '"hello"'.encode('ascii')]) as gjo_mock:
+            result = client.get_status()
+        self.assertEqual(2, gjo_mock.call_count)
+        self.assertEqual('hello', result.status)
 
     def test_get_status_raises_on_timeout_1(self):
         env = JujuData('foo')
         client = ModelClient(env, None, None)
-
-        def get_juju_output(command, *args, **kwargs):
-            raise subprocess.CalledProcessError(1, command)
-
         with patch.object(client, 'get_juju_output',
-                          side_effect=get_juju_output):
+                          side_effect=subprocess.CalledProcessError(
+                              1, 'show-status')):
             with patch('jujupy.client.until_timeout',
                        lambda x: iter([None, None])):
-                with self.assertRaisesRegexp(
+                with self.assertRaisesRegex(
                         Exception, 'Timed out waiting for juju status'):
-                        with patch('jujupy.client.time.sleep'):
-                            client.get_status()
+                    client.get_status()
 
     def test_get_status_raises_on_timeout_2(self):
         env = JujuData('foo')
@@ -856,24 +1267,15 @@ class TestModelClient(ClientTest):
             with patch.object(client, 'get_juju_output',
                               side_effect=StopIteration):
                 with self.assertRaises(StopIteration):
-                    with patch('jujupy.client.time.sleep'):
-                        client.get_status(500)
+                    client.get_status(500)
         mock_ut.assert_called_with(500)
 
     def test_show_model_uses_provided_model_name(self):
         env = JujuData('foo')
         client = ModelClient(env, None, None)
-        show_model_output = dedent("""\
-            bar:
-                status:
-                    current: available
-                    since: 4 minutes ago
-                    migration: 'Some message.'
-                    migration-start: 48 seconds ago
-        """)
-        with patch.object(
-                client, 'get_juju_output',
-                autospect=True, return_value=show_model_output) as m_gjo:
+        show_model_output = _SHOW_MODEL_MIGRATING.format('bar')
+        with patch.object(client, 'get_juju_output',
+                          return_value=show_model_output) as m_gjo:
             output = client.show_model('bar')
         self.assertItemsEqual(['bar'], output.keys())
         m_gjo.assert_called_once_with(
@@ -882,17 +1284,9 @@ class TestModelClient(ClientTest):
     def test_show_model_defaults_to_own_model_name(self):
         env = JujuData('foo')
         client = ModelClient(env, None, None)
-        show_model_output = dedent("""\
-            foo:
-                status:
-                    current: available
-                    since: 4 minutes ago
-                    migration: 'Some message.'
-                    migration-start: 48 seconds ago
-        """)
-        with patch.object(
-                client, 'get_juju_output',
-                autospect=True, return_value=show_model_output) as m_gjo:
+        show_model_output = _SHOW_MODEL_MIGRATING.format('foo')
+        with patch.object(client, 'get_juju_output',
+                          return_value=show_model_output) as m_gjo:
             output = client.show_model()
         self.assertItemsEqual(['foo'], output.keys())
         m_gjo.assert_called_once_with(
@@ -900,127 +1294,23 @@ class TestModelClient(ClientTest):
 
     @staticmethod
     def make_status_yaml(key, machine_value, unit_value):
-        return dedent("""\
-            model:
-              name: foo
-            machines:
-              "0":
-                {0}: {1}
-            applications:
-              jenkins:
-                units:
-                  jenkins/0:
-                    {0}: {2}
-        """.format(key, machine_value, unit_value)).encode('ascii')
-
-    def test_deploy_non_joyent(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mondogb')
-        mock_juju.assert_called_with('deploy', ('mondogb',))
-
-    def test_deploy_joyent(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mondogb')
-        mock_juju.assert_called_with('deploy', ('mondogb',))
-
-    def test_deploy_repository(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('/home/jrandom/repo/mongodb')
-        mock_juju.assert_called_with(
-            'deploy', ('/home/jrandom/repo/mongodb',))
-
-    def test_deploy_to(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mondogb', to='0')
-        mock_juju.assert_called_with(
-            'deploy', ('mondogb', '--to', '0'))
-
-    def test_deploy_service(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:mondogb', service='my-mondogb')
-        mock_juju.assert_called_with(
-            'deploy', ('local:mondogb', 'my-mondogb',))
-
-    def test_deploy_force(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:mondogb', force=True)
-        mock_juju.assert_called_with('deploy', ('local:mondogb', '--force',))
-
-    def test_deploy_xenial_series(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:blah', series='xenial')
-        mock_juju.assert_called_with(
-            'deploy', ('local:blah', '--series', 'xenial'))
-
-    def test_deploy_bionic_series(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:blah', series='bionic')
-        mock_juju.assert_called_with(
-            'deploy', ('local:blah', '--series', 'bionic'))
+        return _STATUS_YAML_TEMPLATE.format(
+            key, machine_value, unit_value).encode('ascii')
 
-    def test_deploy_multiple(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:blah', num=2)
-        mock_juju.assert_called_with(
-            'deploy', ('local:blah', '-n', '2'))
+    @classmethod
+    def make_status_dict(cls, key, machine_value, unit_value):
+        """Return make_status_yaml's output, parsed."""
+        return safe_load(cls.make_status_yaml(key, machine_value, unit_value))
 
-    def test_deploy_resource(self):
-        env = ModelClient(JujuData('foo', {'type': 'lxd'}), None, None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:blah', resource='foo=/path/dir')
-        mock_juju.assert_called_with(
-            'deploy', ('local:blah', '--resource', 'foo=/path/dir'))
-
-    def test_deploy_storage(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mondogb', storage='rootfs,1G')
-        mock_juju.assert_called_with(
-            'deploy', ('mondogb', '--storage', 'rootfs,1G'))
-
-    def test_deploy_constraints(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mondogb', constraints='virt-type=kvm')
-        mock_juju.assert_called_with(
-            'deploy', ('mondogb', '--constraints', 'virt-type=kvm'))
-
-    def test_deploy_bind(self):
-        env = ModelClient(JujuData('foo', {'type': 'lxd'}), None, None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('mydb', bind='backspace')
-        mock_juju.assert_called_with('deploy', ('mydb', '--bind', 'backspace'))
-
-    def test_deploy_aliased(self):
-        env = ModelClient(JujuData('foo', {'type': 'lxd'}), None, None)
-        with patch_juju_call(env) as mock_juju:
-            env.deploy('local:blah', alias='blah-blah')
-        mock_juju.assert_called_with(
-            'deploy', ('local:blah', 'blah-blah'))
+    def test_deploy(self):
+        for charm, kwargs, expected in _DEPLOY_CASES:
+            with self.lxd_juju_mock() as (env, mock_juju):
+                env.deploy(charm, **kwargs)
+            self.assertEqual([call('deploy', expected)],
+                             mock_juju.call_args_list, (charm, kwargs))
 
     def test_attach(self):
-        env = ModelClient(JujuData('foo', {'type': 'lxd'}), None, None)
-        with patch_juju_call(env) as mock_juju:
+        with self.lxd_juju_mock() as (env, mock_juju):
             env.attach('foo', resource='foo=/path/dir')
         mock_juju.assert_called_with('attach', ('foo', 'foo=/path/dir'))
 
@@ -1030,7 +1320,7 @@ class TestModelClient(ClientTest):
         with patch.object(
                 client, 'get_juju_output', return_value=data) as mock_gjo:
             status = client.list_resources('foo')
-        self.assertEqual(status, yaml.safe_load(data))
+        self.assertEqual(status, safe_load(data))
         mock_gjo.assert_called_with(
             'list-resources', '--format', 'yaml', 'foo', '--details')
 
@@ -1049,39 +1339,36 @@ class TestModelClient(ClientTest):
         with patch.object(
                 client, 'list_resources',
                 return_value=resource_list) as mock_lr:
-            with patch('jujupy.client.until_timeout', autospec=True,
+            with patch('jujupy.client.until_timeout',
                        return_value=[0, 1]) as mock_ju:
-                with patch('time.sleep', autospec=True) as mock_ts:
-                    with self.assertRaisesRegexp(
-                            JujuResourceTimeout,
-                            'Timeout waiting for a resource to be downloaded'):
-                        client.wait_for_resource('dummy-resource/foo', 'foo')
+                with self.assertRaisesRegex(
+                        JujuResourceTimeout,
+                        'Timeout waiting for a resource to be downloaded'):
+                    client.wait_for_resource('dummy-resource/foo', 'foo')
         calls = [call('foo'), call('foo')]
         self.assertEqual(mock_lr.mock_calls, calls)
-        self.assertEqual(mock_ts.mock_calls, [call(.1), call(.1)])
+        self.assertEqual(self.sleep_mock.mock_calls, [call(.1), call(.1)])
         self.assertEqual(mock_ju.mock_calls, [call(60)])
 
     def test_wait_for_resource_suppresses_deadline(self):
         client = ModelClient(JujuData('lxd', juju_home=''), None, None)
-        with client_past_deadline(client):
-            real_check_timeouts = client.check_timeouts
+        self.addContext(client_past_deadline(client))
+        real_check_timeouts = client.check_timeouts
 
-            def list_resources(service_or_unit):
-                with real_check_timeouts():
-                    return make_resource_list()
+        def list_resources(service_or_unit):
+            with real_check_timeouts():
+                return make_resource_list()
 
-            with patch.object(client, 'check_timeouts', autospec=True):
-                with patch.object(client, 'list_resources', autospec=True,
-                                  side_effect=list_resources):
-                        client.wait_for_resource('dummy-resource/foo',
-                                                 'app_unit')
+        self.addContext(patch.object(client, 'check_timeouts'))
+        self.addContext(patch.object(client, 'list_resources',
+                                     side_effect=list_resources))
+        client.wait_for_resource('dummy-resource/foo', 'app_unit')
 
     def test_wait_for_resource_checks_deadline(self):
-        resource_list = make_resource_list()
         client = ModelClient(JujuData('lxd', juju_home=''), None, None)
         with client_past_deadline(client):
-            with patch.object(client, 'list_resources', autospec=True,
-                              return_value=resource_list):
+            with patch.object(client, 'list_resources',
+                              return_value=make_resource_list()):
                 with self.assertRaises(SoftDeadlineExceeded):
                     client.wait_for_resource('dummy-resource/foo', 'app_unit')
 
@@ -1102,9 +1389,7 @@ class TestModelClient(ClientTest):
             'deploy', ('bundle:~juju-qa/some-lxd-bundle'), timeout=3600)
 
     def test_upgrade_charm(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '2.34-74', None)
-        with patch_juju_call(env) as mock_juju:
+        with self.lxd_juju_mock() as (env, mock_juju):
             env.upgrade_charm('foo-service',
                               '/bar/repository/angsty/mongodb')
         mock_juju.assert_called_once_with(
@@ -1112,27 +1397,24 @@ class TestModelClient(ClientTest):
                               '/bar/repository/angsty/mongodb',))
 
     def test_remove_service(self):
-        env = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
-        with patch_juju_call(env) as mock_juju:
+        with self.lxd_juju_mock() as (env, mock_juju):
             env.remove_service('mondogb')
         mock_juju.assert_called_with('remove-application', ('mondogb',))
 
     def test_status_until_always_runs_once(self):
-        client = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
+        client = self._lxd_client
         status_txt = self.make_status_yaml('agent-state', 'started', 'started')
         with patch.object(client, 'get_juju_output', return_value=status_txt):
             result = list(client.status_until(-1))
         self.assertEqual(
             [r.status for r in result],
-            [Status.from_text(status_txt.decode('ascii')).status])
+            [self.make_status_dict('agent-state', 'started', 'started')])
 
     def test_status_until_timeout(self):
-        client = ModelClient(
-            JujuData('foo', {'type': 'lxd'}), '1.234-76', None)
+        client = self._lxd_client
         status_txt = self.make_status_yaml('agent-state', 'started', 'started')
-        status_yaml = yaml.safe_load(status_txt)
+        status_yaml = self.make_status_dict(
+            'agent-state', 'started', 'started')
 
         def until_timeout_stub(timeout, start=None):
             return iter([None, None])
@@ -1140,8 +1422,7 @@ class TestModelClient(ClientTest):
         with patch.object(client, 'get_juju_output', return_value=status_txt):
             with patch('jujupy.client.until_timeout',
                        side_effect=until_timeout_stub) as ut_mock:
-                    with patch('jujupy.client.time.sleep'):
-                        result = list(client.status_until(30, 70))
+                    result = list(client.status_until(30, 70))
         self.assertEqual(
             [r.status for r in result], [status_yaml] * 3)
         # until_timeout is called by status as well as status_until.
@@ -1158,31 +1439,25 @@ class TestModelClient(ClientTest):
                 list(client.status_until(0))
 
     def test_add_ssh_machines(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         client = ModelClient(JujuData('foo'), None, 'juju')
-        with patch('subprocess.check_call', autospec=True) as cc_mock:
-            client.add_ssh_machines(['m-foo', 'm-bar', 'm-baz'])
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            0)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-bar'),
-            1)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-baz'),
-            2)
-        self.assertEqual(cc_mock.call_count, 3)
+        for succeeds, expected, raises, pauses in _ADD_SSH_MACHINES_CASES:
+            self.pause_mock.reset_mock()
+            side_effect = [
+                None if ok else subprocess.CalledProcessError(None, None)
+                for ok in succeeds]
+            cc_mock.reset_mock()
+            cc_mock.side_effect = side_effect
+            try:
+                client.add_ssh_machines(['m-foo', 'm-bar', 'm-baz'])
+            except subprocess.CalledProcessError:
+                raised = True
+            else:
+                raised = False
+            self.assertEqual(raises, raised, succeeds)
+            self.assertEqual(expected, cc_mock.call_args_list, succeeds)
+            self.assertEqual(
+                [call(30)] * pauses, self.pause_mock.mock_calls, succeeds)
 
     def test_make_remove_machine_condition(self):
         client = fake_juju_client()
@@ -1192,96 +1467,12 @@ class TestModelClient(ClientTest):
         self.assertEqual(600, condition.timeout)
 
     def test_make_remove_machine_condition_azure(self):
-        client = fake_juju_client()
-        client.env._config['type'] = 'azure'
+        client = fake_juju_client(JujuData('name', {'type': 'azure'}))
         condition = client.make_remove_machine_condition('0')
         self.assertIs(WaitMachineNotPresent, type(condition))
         self.assertEqual('0', condition.machine)
         self.assertEqual(1200, condition.timeout)
 
-    def test_add_ssh_machines_retry(self):
-        client = ModelClient(JujuData('foo'), None, 'juju')
-        with patch('subprocess.check_call', autospec=True,
-                   side_effect=[subprocess.CalledProcessError(None, None),
-                                None, None, None]) as cc_mock:
-            client.add_ssh_machines(['m-foo', 'm-bar', 'm-baz'])
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            0)
-        self.pause_mock.assert_called_once_with(30)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            1)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-bar'),
-            2)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-baz'),
-            3)
-        self.assertEqual(cc_mock.call_count, 4)
-
-    def test_add_ssh_machines_fail_on_second_machine(self):
-        client = ModelClient(JujuData('foo'), None, 'juju')
-        with patch('subprocess.check_call', autospec=True, side_effect=[
-                None, subprocess.CalledProcessError(None, None), None, None
-                ]) as cc_mock:
-            with self.assertRaises(subprocess.CalledProcessError):
-                client.add_ssh_machines(['m-foo', 'm-bar', 'm-baz'])
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            0)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-bar'),
-            1)
-        self.assertEqual(cc_mock.call_count, 2)
-
-    def test_add_ssh_machines_fail_on_second_attempt(self):
-        client = ModelClient(JujuData('foo'), None, 'juju')
-        with patch('subprocess.check_call', autospec=True, side_effect=[
-                subprocess.CalledProcessError(None, None),
-                subprocess.CalledProcessError(None, None)]) as cc_mock:
-            with self.assertRaises(subprocess.CalledProcessError):
-                client.add_ssh_machines(['m-foo', 'm-bar', 'm-baz'])
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            0)
-        assert_juju_call(
-            self,
-            cc_mock,
-            client,
-            ('juju', '--show-log', 'add-machine',
-             '-m', 'foo:foo', 'ssh:m-foo'),
-            1)
-        self.assertEqual(cc_mock.call_count, 2)
-
     def test_remove_machine(self):
         client = fake_juju_client()
         with patch_juju_call(client._backend) as juju_mock:
@@ -1316,44 +1507,25 @@ class TestModelClient(ClientTest):
             client.wait_for_started()
 
     def test_wait_for_started_timeout(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         value = self.make_status_yaml('agent-state', 'pending', 'started')
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch('jujupy.client.until_timeout',
-                   lambda x, start=None: range(1)):
-            with patch.object(client, 'get_juju_output', return_value=value):
-                writes = []
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with self.assertRaisesRegexp(
-                            StatusNotMet,
-                            'Timed out waiting for agents to start in lxd'):
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_started()
-                self.assertEqual(writes, ['pending: 0', ' .', '\n'])
+        with self.status_output(client, value, [0]):
+            with self.assertRaisesRegex(StatusNotMet, _AGENTS_START_RE):
+                client.wait_for_started()
+        self.assertEqual(self.writes, ['pending: 0', ' .', '\n'])
 
     def test_wait_for_started_start(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         value = self.make_status_yaml('agent-state', 'started', 'pending')
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                writes = []
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with self.assertRaisesRegexp(
-                            StatusNotMet,
-                            'Timed out waiting for agents to start in lxd'):
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_started(
-                                start=now - timedelta(1200))
-                self.assertEqual(writes, ['pending: jenkins/0', '\n'])
-
-    def make_ha_status(self, voting='has-vote'):
-        return {'machines': {
-            '0': {'controller-member-status': voting},
-            '1': {'controller-member-status': voting},
-            '2': {'controller-member-status': voting},
-            }}
+                with self.assertRaisesRegex(StatusNotMet, _AGENTS_START_RE):
+                    client.wait_for_started(start=_FAKE_START)
+                self.assertEqual(self.writes, ['pending: jenkins/0', '\n'])
 
     @contextmanager
     def only_status_checks(self, client=None, status=None):
@@ -1373,9 +1545,9 @@ class TestModelClient(ClientTest):
                 with real_check_timeouts():
                     return client.status_class(status, '')
 
-            with patch.object(client, 'get_status', autospec=True,
+            with patch.object(client, 'get_status',
                               side_effect=check):
-                with patch.object(client, 'check_timeouts', autospec=True):
+                with patch.object(client, 'check_timeouts'):
                     yield client
 
     def test__wait_for_status_suppresses_deadline(self):
@@ -1396,7 +1568,7 @@ class TestModelClient(ClientTest):
             client = ModelClient(JujuData('lxd', juju_home=''), None, None)
         with client_past_deadline(client):
             status_obj = client.status_class(status, '')
-            with patch.object(client, 'get_status', autospec=True,
+            with patch.object(client, 'get_status',
                               return_value=status_obj):
                 yield client
 
@@ -1417,6 +1589,7 @@ class TestModelClient(ClientTest):
                 if not (ignore_recoverable and error.recoverable):
                     yield error
 
+        # autospec lets the tests match ignore_recoverable by keyword.
         with patch.object(client.get_status(), 'iter_errors', autospec=True,
                           side_effect=fake_iter_errors) as errors_mock:
             yield errors_mock
@@ -1429,8 +1602,7 @@ class TestModelClient(ClientTest):
         with self.status_does_not_check() as client:
             with self.client_status_errors(client, errors) as errors_mock:
                 with self.assertRaises(StatusNotMet):
-                    with patch('jujupy.client.time.sleep'):
-                        client._wait_for_status(Mock(), translate, timeout=0)
+                    client._wait_for_status(Mock(), translate, timeout=0)
         errors_mock.assert_has_calls(
             [call(ignore_recoverable=True), call(ignore_recoverable=False)])
 
@@ -1442,8 +1614,7 @@ class TestModelClient(ClientTest):
         with self.status_does_not_check() as client:
             with self.client_status_errors(client, errors) as errors_mock:
                 with self.assertRaises(MachineError):
-                    with patch('jujupy.client.time.sleep'):
-                        client._wait_for_status(Mock(), translate, timeout=0)
+                    client._wait_for_status(Mock(), translate, timeout=0)
         errors_mock.assert_called_once_with(ignore_recoverable=True)
 
     def test__wait_for_status_delays_recoverable(self):
@@ -1455,182 +1626,80 @@ class TestModelClient(ClientTest):
         with self.status_does_not_check() as client:
             with self.client_status_errors(client, errors) as errors_mock:
                 with self.assertRaises(UnitError):
-                    with patch('jujupy.client.time.sleep'):
-                        client._wait_for_status(Mock(), translate, timeout=0)
+                    client._wait_for_status(Mock(), translate, timeout=0)
         self.assertEqual(2, errors_mock.call_count)
         errors_mock.assert_has_calls(
             [call(ignore_recoverable=True), call(ignore_recoverable=False)])
 
     def test_wait_for_started_logs_status(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         value = self.make_status_yaml('agent-state', 'pending', 'started')
         client = ModelClient(JujuData('lxd'), None, None)
         with patch.object(client, 'get_juju_output', return_value=value):
-            writes = []
-            with patch.object(GroupReporter, '_write', autospec=True,
-                              side_effect=lambda _, s: writes.append(s)):
-                with self.assertRaisesRegexp(
-                        StatusNotMet,
-                        'Timed out waiting for agents to start in lxd'):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_started(0)
-            self.assertEqual(writes, ['pending: 0', '\n'])
+            with self.assertRaisesRegex(StatusNotMet, _AGENTS_START_RE):
+                client.wait_for_started(0)
+            self.assertEqual(self.writes, ['pending: 0', '\n'])
         self.assertEqual(
             self.log_stream.getvalue(), 'ERROR %s\n' % value.decode('ascii'))
 
     def test_wait_for_subordinate_units(self):
-        value = dedent("""\
-            machines:
-              "0":
-                agent-state: started
-            services:
-              jenkins:
-                units:
-                  jenkins/0:
-                    subordinates:
-                      sub1/0:
-                        agent-state: started
-              ubuntu:
-                units:
-                  ubuntu/0:
-                    subordinates:
-                      sub2/0:
-                        agent-state: started
-                      sub3/0:
-                        agent-state: started
-        """).encode('ascii')
+        value = _SUBORDINATES_YAML
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                with patch(
-                        'jujupy.client.GroupReporter.update') as update_mock:
-                    with patch(
-                            'jujupy.client.GroupReporter.finish'
-                            ) as finish_mock:
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_subordinate_units(
-                                'jenkins', 'sub1', start=now - timedelta(1200))
-        self.assertEqual([], update_mock.call_args_list)
-        finish_mock.assert_called_once_with()
+                with patch.multiple(GroupReporter, update=DEFAULT,
+                                    finish=DEFAULT) as reporter_mocks:
+                    client.wait_for_subordinate_units(
+                        'jenkins', 'sub1', start=_FAKE_START)
+        self.assertEqual([], reporter_mocks['update'].call_args_list)
+        reporter_mocks['finish'].assert_called_once_with()
 
     def test_wait_for_subordinate_units_with_agent_status(self):
-        value = dedent("""\
-            machines:
-              "0":
-                agent-state: started
-            services:
-              jenkins:
-                units:
-                  jenkins/0:
-                    subordinates:
-                      sub1/0:
-                        agent-status:
-                          current: idle
-              ubuntu:
-                units:
-                  ubuntu/0:
-                    subordinates:
-                      sub2/0:
-                        agent-status:
-                          current: idle
-                      sub3/0:
-                        agent-status:
-                          current: idle
-        """).encode('ascii')
+        value = _SUBORDINATES_AGENT_STATUS_YAML
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                with patch(
-                        'jujupy.client.GroupReporter.update') as update_mock:
-                    with patch(
-                            'jujupy.client.GroupReporter.finish'
-                            ) as finish_mock:
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_subordinate_units(
-                                'jenkins', 'sub1', start=now - timedelta(1200))
-        self.assertEqual([], update_mock.call_args_list)
-        finish_mock.assert_called_once_with()
+                with patch.multiple(GroupReporter, update=DEFAULT,
+                                    finish=DEFAULT) as reporter_mocks:
+                    client.wait_for_subordinate_units(
+                        'jenkins', 'sub1', start=_FAKE_START)
+        self.assertEqual([], reporter_mocks['update'].call_args_list)
+        reporter_mocks['finish'].assert_called_once_with()
 
     def test_wait_for_multiple_subordinate_units(self):
-        value = dedent("""\
-            machines:
-              "0":
-                agent-state: started
-            services:
-              ubuntu:
-                units:
-                  ubuntu/0:
-                    subordinates:
-                      sub/0:
-                        agent-state: started
-                  ubuntu/1:
-                    subordinates:
-                      sub/1:
-                        agent-state: started
-        """).encode('ascii')
+        value = _MULTIPLE_SUBORDINATES_YAML
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                with patch(
-                        'jujupy.client.GroupReporter.update') as update_mock:
-                    with patch(
-                            'jujupy.client.GroupReporter.finish'
-                            ) as finish_mock:
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_subordinate_units(
-                                'ubuntu', 'sub', start=now - timedelta(1200))
-        self.assertEqual([], update_mock.call_args_list)
-        finish_mock.assert_called_once_with()
+                with patch.multiple(GroupReporter, update=DEFAULT,
+                                    finish=DEFAULT) as reporter_mocks:
+                    client.wait_for_subordinate_units(
+                        'ubuntu', 'sub', start=_FAKE_START)
+        self.assertEqual([], reporter_mocks['update'].call_args_list)
+        reporter_mocks['finish'].assert_called_once_with()
 
     def test_wait_for_subordinate_units_checks_slash_in_unit_name(self):
-        value = dedent("""\
-            machines:
-              "0":
-                agent-state: started
-            applications:
-              jenkins:
-                units:
-                  jenkins/0:
-                    subordinates:
-                      sub1:
-                        agent-state: started
-        """).encode('ascii')
+        value = _SUBORDINATE_NO_SLASH_YAML
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                with self.assertRaisesRegexp(
-                        StatusNotMet,
-                        'Timed out waiting for agents to start in lxd'):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_subordinate_units(
-                            'jenkins', 'sub1', start=now - timedelta(1200))
+                with self.assertRaisesRegex(StatusNotMet, _AGENTS_START_RE):
+                    client.wait_for_subordinate_units(
+                        'jenkins', 'sub1', start=_FAKE_START)
 
     def test_wait_for_subordinate_units_no_subordinate(self):
-        value = dedent("""\
-            machines:
-              "0":
-                agent-state: started
-            applications:
-              jenkins:
-                units:
-                  jenkins/0:
-                    agent-state: started
-        """).encode('ascii')
+        value = _NO_SUBORDINATE_YAML
         client = ModelClient(JujuData('lxd'), None, None)
-        now = datetime.now() + timedelta(days=1)
-        with patch('utility.until_timeout.now', return_value=now):
+        with self.frozen_clock():
             with patch.object(client, 'get_juju_output', return_value=value):
-                with self.assertRaisesRegexp(
-                        StatusNotMet,
-                        'Timed out waiting for agents to start in lxd'):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_subordinate_units(
-                            'jenkins', 'sub1', start=now - timedelta(1200))
+                with self.assertRaisesRegex(StatusNotMet, _AGENTS_START_RE):
+                    client.wait_for_subordinate_units(
+                        'jenkins', 'sub1', start=_FAKE_START)
 
     def test_wait_for_workload(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         initial_status = Status.from_text("""\
             machines: {}
             applications:
@@ -1648,17 +1717,15 @@ class TestModelClient(ClientTest):
         final_status.status['applications']['jenkins']['units']['jenkins/0'][
             'workload-status']['current'] = 'active'
         client = ModelClient(JujuData('lxd'), None, None)
-        writes = []
-        with patch('utility.until_timeout', autospec=True, return_value=[1]):
-            with patch.object(client, 'get_status', autospec=True,
+        with patch('utility.until_timeout', return_value=[1]):
+            with patch.object(client, 'get_status',
                               side_effect=[initial_status, final_status]):
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_workloads()
-        self.assertEqual(writes, ['waiting: jenkins/0', '\n'])
+                client.wait_for_workloads()
+        self.assertEqual(self.writes, ['waiting: jenkins/0', '\n'])
 
     def test_wait_for_workload_all_unknown(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         status = Status.from_text("""\
             services:
               jenkins:
@@ -1672,17 +1739,15 @@ class TestModelClient(ClientTest):
                         current: unknown
         """)
         client = ModelClient(JujuData('lxd'), None, None)
-        writes = []
-        with patch('utility.until_timeout', autospec=True, return_value=[]):
-            with patch.object(client, 'get_status', autospec=True,
+        with patch('utility.until_timeout', return_value=[]):
+            with patch.object(client, 'get_status',
                               return_value=status):
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_workloads(timeout=1)
-        self.assertEqual(writes, [])
+                client.wait_for_workloads(timeout=1)
+        self.assertEqual(self.writes, [])
 
     def test_wait_for_workload_no_workload_status(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         status = Status.from_text("""\
             services:
               jenkins:
@@ -1691,15 +1756,11 @@ class TestModelClient(ClientTest):
                     agent-state: active
         """)
         client = ModelClient(JujuData('lxd'), None, None)
-        writes = []
-        with patch('utility.until_timeout', autospec=True, return_value=[]):
-            with patch.object(client, 'get_status', autospec=True,
+        with patch('utility.until_timeout', return_value=[]):
+            with patch.object(client, 'get_status',
                               return_value=status):
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_workloads(timeout=1)
-        self.assertEqual(writes, [])
+                client.wait_for_workloads(timeout=1)
+        self.assertEqual(self.writes, [])
 
     def test_list_models(self):
         client = ModelClient(JujuData('foo'), None, None)
@@ -1807,102 +1868,14 @@ class TestModelClient(ClientTest):
             controller_name = client.get_controller_model_name()
         self.assertEqual('controller', controller_name)
 
-    def test_get_model_uuid_returns_uuid(self):
-        model_uuid = '9ed1bde9-45c6-4d41-851d-33fdba7fa194'
-        yaml_string = dedent("""\
-        foo:
-          name: foo
-          model-uuid: {uuid}
-          controller-uuid: eb67e1eb-6c54-45f5-8b6a-b6243be97202
-          owner: admin
-          cloud: lxd
-          region: localhost
-          type: lxd
-          life: alive
-          status:
-            current: available
-            since: 1 minute ago
-          users:
-            admin:
-              display-name: admin
-              access: admin
-              last-connection: just now
-            """.format(uuid=model_uuid))
-        client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output') as m_get_juju_output:
-            m_get_juju_output.return_value = yaml_string
-            self.assertEqual(
-                client.get_model_uuid(),
-                model_uuid
-            )
-            m_get_juju_output.assert_called_once_with(
-                'show-model', '--format', 'yaml', 'foo:foo', include_e=False)
-
-    def test_get_controller_model_uuid_returns_uuid(self):
-        controller_uuid = 'eb67e1eb-6c54-45f5-8b6a-b6243be97202'
-        controller_model_uuid = '1c908e10-4f07-459a-8419-bb61553a4660'
-        yaml_string = dedent("""\
-        controller:
-          name: controller
-          model-uuid: {model}
-          controller-uuid: {controller}
-          controller-name: localtempveebers
-          owner: admin
-          cloud: lxd
-          region: localhost
-          type: lxd
-          life: alive
-          status:
-            current: available
-            since: 59 seconds ago
-          users:
-            admin:
-              display-name: admin
-              access: admin
-              last-connection: just now""".format(model=controller_model_uuid,
-                                                  controller=controller_uuid))
-        client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output') as m_get_juju_output:
-            m_get_juju_output.return_value = yaml_string
-            self.assertEqual(
-                client.get_controller_model_uuid(),
-                controller_model_uuid
-            )
-            m_get_juju_output.assert_called_once_with(
-                'show-model', 'controller',
-                '--format', 'yaml', include_e=False)
-
-    def test_get_controller_uuid_returns_uuid(self):
-        controller_uuid = 'eb67e1eb-6c54-45f5-8b6a-b6243be97202'
-        yaml_string = dedent("""\
-        foo:
-          details:
-            uuid: {uuid}
-            api-endpoints: ['10.194.140.213:17070']
-            cloud: lxd
-            region: localhost
-          models:
-            controller:
-              uuid: {uuid}
-            default:
-              uuid: 772cdd39-b454-4bd5-8704-dc9aa9ff1750
-          current-model: default
-          account:
-            user: admin
-          bootstrap-config:
-            config:
-            cloud: lxd
-            cloud-type: lxd
-            region: localhost""".format(uuid=controller_uuid))
+    def test_output_lookups(self):
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output') as m_get_juju_output:
-            m_get_juju_output.return_value = yaml_string
-            self.assertEqual(
-                client.get_controller_uuid(),
-                controller_uuid
-            )
-            m_get_juju_output.assert_called_once_with(
-                'show-controller', 'foo', '--format', 'yaml', include_e=False)
+        for method, output, expected, args in _OUTPUT_LOOKUP_CASES:
+            with patch.object(client, 'get_juju_output',
+                              return_value=output) as gjo_mock:
+                self.assertEqual(expected, getattr(client, method)(), method)
+            self.assertEqual([call(*args, include_e=False)],
+                             gjo_mock.call_args_list, method)
 
     def test_get_controller_client(self):
         client = ModelClient(
@@ -1919,34 +1892,6 @@ class TestModelClient(ClientTest):
             client.list_controllers()
         j_mock.assert_called_once_with('list-controllers', (), include_e=False)
 
-    def test_get_controller_endpoint_ipv4(self):
-        data = """\
-          foo:
-            details:
-              api-endpoints: ['10.0.0.1:17070', '10.0.0.2:17070']
-        """
-        client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output',
-                          return_value=data) as gjo_mock:
-            endpoint = client.get_controller_endpoint()
-        self.assertEqual(('10.0.0.1', '17070'), endpoint)
-        gjo_mock.assert_called_once_with(
-            'show-controller', 'foo', include_e=False)
-
-    def test_get_controller_endpoint_ipv6(self):
-        data = """\
-          foo:
-            details:
-              api-endpoints: ['[::1]:17070', '[fe80::216:3eff:0:9dc7]:17070']
-        """
-        client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output',
-                          return_value=data) as gjo_mock:
-            endpoint = client.get_controller_endpoint()
-        self.assertEqual(('::1', '17070'), endpoint)
-        gjo_mock.assert_called_once_with(
-            'show-controller', 'foo', include_e=False)
-
     def test_get_controller_controller_name(self):
         data = """\
           bar:
@@ -1984,9 +1929,9 @@ class TestModelClient(ClientTest):
                 controller-member-status: has-vote
         """)
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_status', autospec=True,
+        with patch.object(client, 'get_status',
                           return_value=status):
-            with patch.object(client, 'get_controller_endpoint', autospec=True,
+            with patch.object(client, 'get_controller_endpoint',
                               return_value=('10.0.0.3', '17070')) as gce_mock:
                 with patch.object(client, 'get_controller_member_status',
                                   wraps=client.get_controller_member_status,
@@ -2023,7 +1968,7 @@ class TestModelClient(ClientTest):
                 controller-member-status: has-vote
         """)
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_status', autospec=True,
+        with patch.object(client, 'get_status',
                           return_value=status):
             with patch.object(client, 'get_controller_endpoint') as gce_mock:
                 members = client.get_controller_members()
@@ -2044,7 +1989,7 @@ class TestModelClient(ClientTest):
             Machine('2', {}),
         ]
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_controller_members', autospec=True,
+        with patch.object(client, 'get_controller_members',
                           return_value=members):
             leader = client.get_controller_leader()
         self.assertEqual(Machine('3', {}), leader)
@@ -2054,142 +1999,89 @@ class TestModelClient(ClientTest):
         return client.get_controller_client()
 
     def test_wait_for_ha(self):
-        value = yaml.safe_dump(self.make_ha_status()).encode('ascii')
         client = self.make_controller_client()
         with patch.object(client, 'get_juju_output',
-                          return_value=value) as gjo_mock:
+                          return_value=_HA_STATUS_YAML) as gjo_mock:
             client.wait_for_ha()
         gjo_mock.assert_called_once_with(
             'show-status', '--format', 'yaml', controller=False)
 
     def test_wait_for_ha_requires_controller_client(self):
         client = fake_juju_client()
-        with self.assertRaisesRegexp(ValueError, 'wait_for_ha'):
+        with self.assertRaisesRegex(ValueError, 'wait_for_ha'):
             client.wait_for_ha()
 
     def test_wait_for_ha_no_has_vote(self):
-        value = yaml.safe_dump(
-            self.make_ha_status(voting='no-vote')).encode('ascii')
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         client = self.make_controller_client()
-        with patch.object(client, 'get_juju_output', return_value=value):
-            writes = []
-            with patch('jujupy.client.until_timeout', autospec=True,
-                       return_value=[2, 1]):
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with self.assertRaisesRegexp(
-                            Exception,
-                            'Timed out waiting for voting to be enabled.'):
-                        with patch('jujupy.client.time.sleep'):
-                            client.wait_for_ha()
-        dots = len(writes) - 3
+        with self.status_output(client, _HA_STATUS_NO_VOTE_YAML, [2, 1]):
+            with self.assertRaisesRegex(Exception, _VOTING_RE):
+                client.wait_for_ha()
+        dots = len(self.writes) - 3
         expected = ['no-vote: 0, 1, 2', ' .'] + (['.'] * dots) + ['\n']
-        self.assertEqual(writes, expected)
+        self.assertEqual(self.writes, expected)
 
     def test_wait_for_ha_timeout(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'controller-member-status': 'has-vote'},
-                '1': {'controller-member-status': 'has-vote'},
-            },
-            'services': {},
-        })
         client = self.make_controller_client()
-        status = client.status_class.from_text(value)
+        status = client.status_class.from_text(_HA_TWO_VOTERS_YAML)
         with patch('jujupy.client.until_timeout',
                    lambda x, start=None: range(0)):
             with patch.object(client, 'get_status', return_value=status
                               ) as get_status_mock:
-                with patch('jujupy.client.time.sleep'):
-                    with self.assertRaisesRegexp(
-                            StatusNotMet,
-                            'Timed out waiting for voting to be enabled.'):
-                        client.wait_for_ha()
+                with self.assertRaisesRegex(StatusNotMet, _VOTING_RE):
+                    client.wait_for_ha()
         get_status_mock.assert_called_once_with()
 
     def test_wait_for_ha_timeout_with_status_error(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'agent-state-info': 'running'},
-                '1': {'agent-state-info': 'error: foo'},
-            },
-            'services': {},
-        }).encode('ascii')
         client = self.make_controller_client()
-        with patch('jujupy.client.until_timeout', autospec=True,
-                   return_value=[2, 1]):
-            with patch.object(client, 'get_juju_output', return_value=value):
-                with self.assertRaisesRegexp(
-                        ErroredUnit, '1 is in state error: foo'):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_ha()
+        with self.status_output(client, _HA_MACHINE_ERROR_YAML, [2, 1]):
+            with self.assertRaisesRegex(
+                    ErroredUnit, '1 is in state error: foo'):
+                client.wait_for_ha()
 
     def test_wait_for_ha_suppresses_deadline(self):
         with self.only_status_checks(self.make_controller_client(),
-                                     self.make_ha_status()) as client:
+                                     _ha_status('has-vote')) as client:
             client.wait_for_ha()
 
     def test_wait_for_ha_checks_deadline(self):
         with self.status_does_not_check(self.make_controller_client(),
-                                        self.make_ha_status()) as client:
+                                        _ha_status('has-vote')) as client:
             with self.assertRaises(SoftDeadlineExceeded):
                 client.wait_for_ha()
 
     def test_wait_for_deploy_started(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'agent-state': 'started'},
-            },
-            'applications': {
-                'jenkins': {
-                    'units': {
-                        'jenkins/1': {'baz': 'qux'}
-                    }
-                }
-            }
-        }).encode('ascii')
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch.object(client, 'get_juju_output', return_value=value):
+        with patch.object(client, 'get_juju_output',
+                          return_value=_DEPLOYED_STATUS_YAML):
             client.wait_for_deploy_started()
 
-    def test_wait_for_deploy_started_timeout(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'agent-state': 'started'},
-            },
-            'applications': {},
-        })
+    def assert_wait_times_out(self, output, remaining, exc_type, pattern,
+                              wait):
+        """Assert that wait(client) raises exc_type matching pattern.
+
+        Every status check sees output, and until_timeout yields remaining.
+        """
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch('jujupy.client.until_timeout', lambda x: range(0)):
-            with patch.object(client, 'get_juju_output', return_value=value):
-                with self.assertRaisesRegexp(
-                        StatusNotMet,
-                        'Timed out waiting for applications to start.'):
-                    with patch('jujupy.client.time.sleep'):
-                        client.wait_for_deploy_started()
-
-    def make_deployed_status(self):
-        return {
-            'machines': {
-                '0': {'agent-state': 'started'},
-            },
-            'applications': {
-                'jenkins': {
-                    'units': {
-                        'jenkins/1': {'baz': 'qux'}
-                    }
-                }
-            }
-        }
+        with self.status_output(client, output, remaining):
+            with self.assertRaisesRegex(exc_type, pattern):
+                wait(client)
+
+    def test_wait_for_deploy_started_timeout(self):
+        self.assert_wait_times_out(
+            _NOT_DEPLOYED_STATUS_YAML, [], StatusNotMet,
+            'Timed out waiting for applications to start.',
+            lambda client: client.wait_for_deploy_started())
 
     def test_wait_for_deploy_started_suppresses_deadline(self):
         with self.only_status_checks(
-                status=self.make_deployed_status()) as client:
+                status=_deployed_status()) as client:
             client.wait_for_deploy_started()
 
     def test_wait_for_deploy_started_checks_deadline(self):
         with self.status_does_not_check(
-                status=self.make_deployed_status()) as client:
+                status=_deployed_status()) as client:
             with self.assertRaises(SoftDeadlineExceeded):
                 client.wait_for_deploy_started()
 
@@ -2200,82 +2092,45 @@ class TestModelClient(ClientTest):
             client.wait_for_version('1.17.2')
 
     def test_wait_for_version_timeout(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         value = self.make_status_yaml('agent-version', '1.17.2', '1.17.1')
-        client = ModelClient(JujuData('lxd'), None, None)
-        writes = []
-        with patch('jujupy.client.until_timeout',
-                   lambda x, start=None: [x]):
-            with patch.object(client, 'get_juju_output', return_value=value):
-                with patch.object(GroupReporter, '_write', autospec=True,
-                                  side_effect=lambda _, s: writes.append(s)):
-                    with self.assertRaisesRegexp(
-                            StatusNotMet, 'Some versions did not update'):
-                            with patch('jujupy.client.time.sleep'):
-                                client.wait_for_version('1.17.2')
-        self.assertEqual(writes, ['1.17.1: jenkins/0', ' .', '\n'])
+        self.assert_wait_times_out(
+            value, [300], StatusNotMet, 'Some versions did not update',
+            lambda client: client.wait_for_version('1.17.2'))
+        self.assertEqual(self.writes, ['1.17.1: jenkins/0', ' .', '\n'])
 
     def test_wait_for_version_handles_connection_error(self):
         err = subprocess.CalledProcessError(2, 'foo')
         err.stderr = 'Unable to connect to environment'
         err = CannotConnectEnv(err)
         status = self.make_status_yaml('agent-version', '1.17.2', '1.17.2')
-        actions = [err, status]
-
-        def get_juju_output_fake(*args, **kwargs):
-            action = actions.pop(0)
-            if isinstance(action, Exception):
-                raise action
-            else:
-                return action
-
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch.object(client, 'get_juju_output', get_juju_output_fake):
+        with patch.object(client, 'get_juju_output',
+                          side_effect=[err, status]):
             client.wait_for_version('1.17.2')
 
     def test_wait_for_version_raises_non_connection_error(self):
         err = Exception('foo')
         status = self.make_status_yaml('agent-version', '1.17.2', '1.17.2')
-        actions = [err, status]
-
-        def get_juju_output_fake(*args, **kwargs):
-            action = actions.pop(0)
-            if isinstance(action, Exception):
-                raise action
-            else:
-                return action
-
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch.object(client, 'get_juju_output', get_juju_output_fake):
-            with self.assertRaisesRegexp(Exception, 'foo'):
+        with patch.object(client, 'get_juju_output',
+                          side_effect=[err, status]):
+            with self.assertRaisesRegex(Exception, 'foo'):
                 client.wait_for_version('1.17.2')
 
     def test_wait_just_machine_0(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'agent-state': 'started'},
-            },
-        }).encode('ascii')
         client = ModelClient(JujuData('lxd'), None, None)
-        with patch.object(client, 'get_juju_output', return_value=value):
-            with patch('jujupy.client.time.sleep'):
-                client.wait_for(WaitMachineNotPresent('1'), quiet=True)
+        with patch.object(client, 'get_juju_output',
+                          return_value=_MACHINE_0_YAML):
+            client.wait_for(WaitMachineNotPresent('1'), quiet=True)
 
     def test_wait_just_machine_0_timeout(self):
-        value = yaml.safe_dump({
-            'machines': {
-                '0': {'agent-state': 'started'},
-                '1': {'agent-state': 'started'},
-            },
-        }).encode('ascii')
-        client = ModelClient(JujuData('lxd'), None, None)
-        with patch.object(client, 'get_juju_output', return_value=value), \
-            patch('jujupy.client.until_timeout',
-                  lambda x, start=None: range(1)), \
-            self.assertRaisesRegexp(
-                Exception,
-                'Timed out waiting for machine removal 1'):
-            with patch('jujupy.client.time.sleep'):
-                client.wait_for(WaitMachineNotPresent('1'), quiet=True)
+        self.assert_wait_times_out(
+            _MACHINES_0_1_YAML, [0], Exception,
+            'Timed out waiting for machine removal 1',
+            lambda client: client.wait_for(
+                WaitMachineNotPresent('1'), quiet=True))
 
     class NeverSatisfied:
 
@@ -2299,11 +2154,12 @@ class TestModelClient(ClientTest):
         with self.assertRaises(never_satisfied.NeverSatisfiedException):
             with patch.object(client, 'status_until', return_value=iter(
                     [Status({'machines': {}}, '')])) as mock_su:
-                with patch('jujupy.client.time.sleep'):
-                    client.wait_for(never_satisfied, quiet=True)
+                client.wait_for(never_satisfied, quiet=True)
         mock_su.assert_called_once_with(1234)
 
     def test_wait_for_emits_output(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         client = fake_juju_client()
         client.bootstrap()
         mock_wait = Mock(timeout=300, already_satisfied=False)
@@ -2313,14 +2169,12 @@ class TestModelClient(ClientTest):
             [('0', 'still-present')],
             [],
             ]
-        writes = []
-        with patch.object(GroupReporter, '_write', autospec=True,
-                          side_effect=lambda _, s: writes.append(s)):
-            with patch('jujupy.client.time.sleep'):
-                client.wait_for(mock_wait)
-        self.assertEqual('still-present: 0 ..\n', ''.join(writes))
+        client.wait_for(mock_wait)
+        self.assertEqual('still-present: 0 ..\n', ''.join(self.writes))
 
     def test_wait_for_quiet(self):
+        self.addContext(patch.object(
+            GroupReporter, '_write', side_effect=self.writes.append))
         client = fake_juju_client()
         client.bootstrap()
         mock_wait = Mock(timeout=300)
@@ -2330,12 +2184,8 @@ class TestModelClient(ClientTest):
             [('0', 'still-present')],
             [],
             ]
-        writes = []
-        with patch.object(GroupReporter, '_write', autospec=True,
-                          side_effect=lambda _, s: writes.append(s)):
-            with patch('jujupy.client.time.sleep'):
-                client.wait_for(mock_wait, quiet=True)
-        self.assertEqual('', ''.join(writes))
+        client.wait_for(mock_wait, quiet=True)
+        self.assertEqual('', ''.join(self.writes))
 
     def test_wait_bad_status(self):
         client = fake_juju_client()
@@ -2348,8 +2198,7 @@ class TestModelClient(ClientTest):
         with self.assertRaises(MachineError):
             with patch.object(client, 'status_until', lambda timeout: iter(
                     [bad_status])):
-                with patch('jujupy.client.time.sleep'):
-                    client.wait_for(never_satisfied, quiet=True)
+                client.wait_for(never_satisfied, quiet=True)
 
     def test_wait_bad_status_recoverable_recovered(self):
         client = fake_juju_client()
@@ -2366,8 +2215,7 @@ class TestModelClient(ClientTest):
         with self.assertRaises(never_satisfied.NeverSatisfiedException):
             with patch.object(client, 'status_until', lambda timeout: iter(
                     [bad_status, good_status])):
-                with patch('jujupy.client.time.sleep'):
-                    client.wait_for(never_satisfied, quiet=True)
+                client.wait_for(never_satisfied, quiet=True)
 
     def test_wait_bad_status_recoverable_timed_out(self):
         client = fake_juju_client()
@@ -2383,17 +2231,15 @@ class TestModelClient(ClientTest):
         with self.assertRaises(AppError):
             with patch.object(client, 'status_until', lambda timeout: iter(
                     [bad_status])):
-                with patch('jujupy.client.time.sleep'):
-                    client.wait_for(never_satisfied, quiet=True)
+                client.wait_for(never_satisfied, quiet=True)
 
     def test_wait_empty_list(self):
         client = fake_juju_client()
         client.bootstrap()
         with patch.object(client, 'status_until', side_effect=StatusTimeout):
-            with patch('jujupy.client.time.sleep'):
-                self.assertEqual(client.wait_for(
-                    ConditionList([]), quiet=True).status,
-                    client.get_status().status)
+            self.assertEqual(client.wait_for(
+                ConditionList([]), quiet=True).status,
+                client.get_status().status)
 
     def test_set_model_constraints(self):
         client = ModelClient(JujuData('bar', {}), None, '/foo')
@@ -2404,10 +2250,9 @@ class TestModelClient(ClientTest):
 
     def test_get_model_config(self):
         env = JujuData('foo', None)
-        fake_popen = FakePopen(yaml.safe_dump({'bar': 'baz'}), None, 0)
         client = ModelClient(env, None, 'juju')
-        with patch('subprocess.Popen', return_value=fake_popen) as po_mock:
-            result = client.get_model_config()
+        po_mock = self.stub_popen(_POPEN_MODEL_CONFIG)
+        result = client.get_model_config()
         assert_juju_call(
             self, po_mock, client, (
                 'juju', '--show-log',
@@ -2416,10 +2261,9 @@ class TestModelClient(ClientTest):
 
     def test_get_env_option(self):
         env = JujuData('foo', None)
-        fake_popen = FakePopen('https://example.org/juju/tools', None, 0)
         client = ModelClient(env, None, 'juju')
-        with patch('subprocess.Popen', return_value=fake_popen) as mock:
-            result = client.get_env_option('tools-metadata-url')
+        mock = self.stub_popen(_POPEN_TOOLS_URL)
+        result = client.get_env_option('tools-metadata-url')
         self.assertEqual(
             mock.call_args[0][0],
             ('juju', '--show-log', 'model-config', '-m', 'foo:foo',
@@ -2427,25 +2271,21 @@ class TestModelClient(ClientTest):
         self.assertEqual('https://example.org/juju/tools', result)
 
     def test_set_env_option(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('foo')
         client = ModelClient(env, None, 'juju')
-        with patch('subprocess.check_call') as mock:
-            client.set_env_option(
-                'tools-metadata-url', 'https://example.org/juju/tools')
-        environ = dict(os.environ)
-        environ['JUJU_HOME'] = client.env.juju_home
-        mock.assert_called_with(
+        client.set_env_option(
+            'tools-metadata-url', 'https://example.org/juju/tools')
+        cc_mock.assert_called_with(
             ('juju', '--show-log', 'model-config', '-m', 'foo:foo',
              'tools-metadata-url=https://example.org/juju/tools'), stderr=None)
 
     def test_unset_env_option(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('foo')
         client = ModelClient(env, None, 'juju')
-        with patch('subprocess.check_call') as mock:
-            client.unset_env_option('tools-metadata-url')
-        environ = dict(os.environ)
-        environ['JUJU_HOME'] = client.env.juju_home
-        mock.assert_called_with(
+        client.unset_env_option('tools-metadata-url')
+        cc_mock.assert_called_with(
             ('juju', '--show-log', 'model-config', '-m', 'foo:foo',
              '--reset', 'tools-metadata-url'), stderr=None)
 
@@ -2458,9 +2298,9 @@ class TestModelClient(ClientTest):
 
     def test_get_model_defaults(self):
         data = {'some-key': {'default': 'black'}}
-        raw_yaml = yaml.safe_dump(data)
+        raw_yaml = safe_dump(data)
         client = fake_juju_client()
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value=raw_yaml) as output_mock:
             retval = client.get_model_defaults('some-key')
         self.assertEqual(data, retval)
@@ -2468,9 +2308,9 @@ class TestModelClient(ClientTest):
             'model-defaults', '--format', 'yaml', 'some-key', include_e=False)
 
     def test_get_model_defaults_cloud_region(self):
-        raw_yaml = yaml.safe_dump({'some-key': {'default': 'red'}})
+        raw_yaml = safe_dump({'some-key': {'default': 'red'}})
         client = fake_juju_client()
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value=raw_yaml) as output_mock:
             client.get_model_defaults('some-key', region='us-east-1')
         output_mock.assert_called_once_with(
@@ -2479,14 +2319,14 @@ class TestModelClient(ClientTest):
 
     def test_set_model_defaults(self):
         client = fake_juju_client()
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.set_model_defaults('some-key', 'white')
         juju_mock.assert_called_once_with(
             'model-defaults', ('some-key=white',), include_e=False)
 
     def test_set_model_defaults_cloud_region(self):
         client = fake_juju_client()
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.set_model_defaults('some-key', 'white', region='us-east-1')
         juju_mock.assert_called_once_with(
             'model-defaults', ('us-east-1', 'some-key=white',),
@@ -2494,14 +2334,14 @@ class TestModelClient(ClientTest):
 
     def test_unset_model_defaults(self):
         client = fake_juju_client()
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.unset_model_defaults('some-key')
         juju_mock.assert_called_once_with(
             'model-defaults', ('--reset', 'some-key'), include_e=False)
 
     def test_unset_model_defaults_cloud_region(self):
         client = fake_juju_client()
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.unset_model_defaults('some-key', region='us-east-1')
         juju_mock.assert_called_once_with(
             'model-defaults', ('us-east-1', '--reset', 'some-key'),
@@ -2530,14 +2370,13 @@ class TestModelClient(ClientTest):
         self.assertEqual(0, mock_set.call_count)
 
     def test_juju(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('qux')
         client = ModelClient(env, None, 'juju')
-        with patch('subprocess.check_call') as mock:
-            client.juju('foo', ('bar', 'baz'))
-        environ = dict(os.environ)
-        environ['JUJU_HOME'] = client.env.juju_home
-        mock.assert_called_with(('juju', '--show-log', 'foo', '-m', 'qux:qux',
-                                 'bar', 'baz'), stderr=None)
+        client.juju('foo', ('bar', 'baz'))
+        cc_mock.assert_called_with(
+            ('juju', '--show-log', 'foo', '-m', 'qux:qux', 'bar', 'baz'),
+            stderr=None)
 
     def test_expect_returns_pexpect_spawn_object(self):
         env = JujuData('qux')
@@ -2562,43 +2401,45 @@ class TestModelClient(ClientTest):
                 )
 
     def test_juju_env(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
 
         def check_path(*args, **kwargs):
-            self.assertRegexpMatches(os.environ['PATH'], r'/foobar\:')
-        with patch('subprocess.check_call', side_effect=check_path):
-            client.juju('foo', ('bar', 'baz'))
+            self.assertRegex(os.environ['PATH'], r'/foobar\:')
+        cc_mock.side_effect = check_path
+        client.juju('foo', ('bar', 'baz'))
 
     def test_juju_no_check(self):
+        call_mock = self.addContext(patch.object(subprocess, 'call'))
         env = JujuData('qux')
         client = ModelClient(env, None, 'juju')
-        environ = dict(os.environ)
-        environ['JUJU_HOME'] = client.env.juju_home
-        with patch('subprocess.call') as mock:
-            client.juju('foo', ('bar', 'baz'), check=False)
-        mock.assert_called_with(('juju', '--show-log', 'foo', '-m', 'qux:qux',
-                                 'bar', 'baz'), stderr=None)
+        client.juju('foo', ('bar', 'baz'), check=False)
+        call_mock.assert_called_with(
+            ('juju', '--show-log', 'foo', '-m', 'qux:qux', 'bar', 'baz'),
+            stderr=None)
 
     def test_juju_no_check_env(self):
+        call_mock = self.addContext(patch.object(subprocess, 'call'))
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
 
         def check_path(*args, **kwargs):
-            self.assertRegexpMatches(os.environ['PATH'], r'/foobar\:')
-        with patch('subprocess.call', side_effect=check_path):
-            client.juju('foo', ('bar', 'baz'), check=False)
+            self.assertRegex(os.environ['PATH'], r'/foobar\:')
+        call_mock.side_effect = check_path
+        client.juju('foo', ('bar', 'baz'), check=False)
 
     def test_juju_timeout(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.check_call') as cc_mock:
-            client.juju('foo', ('bar', 'baz'), timeout=58)
+        client.juju('foo', ('bar', 'baz'), timeout=58)
         self.assertEqual(cc_mock.call_args[0][0], (
             sys.executable, get_timeout_path(), '58.00', '--', 'baz',
             '--show-log', 'foo', '-m', 'qux:qux', 'bar', 'baz'))
 
     def test_juju_juju_home(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('qux')
         os.environ['JUJU_HOME'] = 'foo'
         client = ModelClient(env, None, '/foobar/baz')
@@ -2609,12 +2450,13 @@ class TestModelClient(ClientTest):
             self.assertEqual(os.environ['JUJU_HOME'], 'asdf')
             yield
 
-        with patch('subprocess.check_call', side_effect=check_home):
-            client.juju('foo', ('bar', 'baz'))
-            client.env.juju_home = 'asdf'
-            client.juju('foo', ('bar', 'baz'))
+        cc_mock.side_effect = check_home
+        client.juju('foo', ('bar', 'baz'))
+        client.env.juju_home = 'asdf'
+        client.juju('foo', ('bar', 'baz'))
 
     def test_juju_extra_env(self):
+        cc_mock = self.addContext(patch.object(subprocess, 'check_call'))
         env = JujuData('qux')
         client = ModelClient(env, None, 'juju')
         extra_env = {'JUJU': '/juju', 'JUJU_HOME': client.env.juju_home}
@@ -2622,9 +2464,9 @@ class TestModelClient(ClientTest):
         def check_env(*args, **kwargs):
             self.assertEqual('/juju', os.environ['JUJU'])
 
-        with patch('subprocess.check_call', side_effect=check_env) as mock:
-            client.juju('quickstart', ('bar', 'baz'), extra_env=extra_env)
-        mock.assert_called_with(
+        cc_mock.side_effect = check_env
+        client.juju('quickstart', ('bar', 'baz'), extra_env=extra_env)
+        cc_mock.assert_called_with(
             ('juju', '--show-log', 'quickstart', '-m', 'qux:qux',
              'bar', 'baz'), stderr=None)
 
@@ -2632,11 +2474,8 @@ class TestModelClient(ClientTest):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
 
-        with patch(
-                'subprocess.Popen',
-                return_value=FakePopen('foojuju-backup-24.tgzz', '', 0),
-                ) as popen_mock:
-            backup_file = client.backup()
+        popen_mock = self.stub_popen(_POPEN_BACKUP_TGZ)
+        backup_file = client.backup()
         self.assertEqual(backup_file, os.path.abspath('juju-backup-24.tgz'))
         assert_juju_call(self, popen_mock, client, ('baz', '--show-log',
                          'create-backup', '-m', 'qux:qux'))
@@ -2644,29 +2483,24 @@ class TestModelClient(ClientTest):
     def test_juju_backup_with_tar_gz(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.Popen',
-                   return_value=FakePopen(
-                       'foojuju-backup-123-456.tar.gzbar', '', 0)):
-            backup_file = client.backup()
+        self.stub_popen(_POPEN_BACKUP_TAR_GZ)
+        backup_file = client.backup()
         self.assertEqual(
             backup_file, os.path.abspath('juju-backup-123-456.tar.gz'))
 
     def test_juju_backup_no_file(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.Popen', return_value=FakePopen('', '', 0)):
-            with self.assertRaisesRegexp(
-                    Exception, 'The backup file was not found in output'):
-                client.backup()
+        self.stub_popen(_POPEN_EMPTY)
+        with self.assertRaisesRegex(Exception, _NO_BACKUP_FILE_RE):
+            client.backup()
 
     def test_juju_backup_wrong_file(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.Popen',
-                   return_value=FakePopen('mumu-backup-24.tgz', '', 0)):
-            with self.assertRaisesRegexp(
-                    Exception, 'The backup file was not found in output'):
-                client.backup()
+        self.stub_popen(_POPEN_BACKUP_WRONG)
+        with self.assertRaisesRegex(Exception, _NO_BACKUP_FILE_RE):
+            client.backup()
 
     def test_juju_backup_environ(self):
         env = JujuData('qux')
@@ -2675,8 +2509,8 @@ class TestModelClient(ClientTest):
 
         def side_effect(*args, **kwargs):
             self.assertEqual(environ, os.environ)
-            return FakePopen('foojuju-backup-123-456.tar.gzbar', '', 0)
-        with patch('subprocess.Popen', side_effect=side_effect):
+            return _POPEN_BACKUP_TAR_GZ
+        with patch.object(subprocess, 'Popen', side_effect=side_effect):
             client.backup()
             self.assertNotEqual(environ, os.environ)
 
@@ -2701,7 +2535,7 @@ class TestModelClient(ClientTest):
     def test_enable_ha(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch.object(client, 'juju', autospec=True) as eha_mock:
+        with patch_juju_call(client) as eha_mock:
             client.enable_ha()
         eha_mock.assert_called_once_with(
             'enable-ha', ('-n', '3', '-c', 'qux'), include_e=False)
@@ -2709,7 +2543,7 @@ class TestModelClient(ClientTest):
     def test_juju_async(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.Popen') as popen_class_mock:
+        with patch.object(subprocess, 'Popen') as popen_class_mock:
             with client.juju_async('foo', ('bar', 'baz')) as proc:
                 assert_juju_call(
                     self,
@@ -2725,7 +2559,7 @@ class TestModelClient(ClientTest):
     def test_juju_async_failure(self):
         env = JujuData('qux')
         client = ModelClient(env, None, '/foobar/baz')
-        with patch('subprocess.Popen') as popen_class_mock:
+        with patch.object(subprocess, 'Popen') as popen_class_mock:
             with self.assertRaises(subprocess.CalledProcessError) as err_cxt:
                 with client.juju_async('foo', ('bar', 'baz')):
                     proc_mock = popen_class_mock.return_value
@@ -2739,7 +2573,7 @@ class TestModelClient(ClientTest):
         client = ModelClient(env, None, '/foobar/baz')
         environ = client._shell_environ()
         proc_mock = Mock()
-        with patch('subprocess.Popen') as popen_class_mock:
+        with patch.object(subprocess, 'Popen') as popen_class_mock:
 
             def check_environ(*args, **kwargs):
                 self.assertEqual(environ, os.environ)
@@ -2849,8 +2683,8 @@ class TestModelClient(ClientTest):
                              '1.23-series-arch', None)
         with patch.object(ModelClient, 'get_juju_output') as mock:
             mock.return_value = "some bad text"
-            with self.assertRaisesRegexp(Exception,
-                                         "Action id not found in output"):
+            with self.assertRaisesRegex(Exception,
+                                        "Action id not found in output"):
                 client.action_do("foo/0", "myaction", "param=5")
 
     def test_action_fetch(self):
@@ -2871,7 +2705,7 @@ class TestModelClient(ClientTest):
         ret = "status: pending\nfoo: bar"
         with patch.object(ModelClient,
                           'get_juju_output', return_value=ret):
-            with self.assertRaisesRegexp(
+            with self.assertRaisesRegex(
                 Exception,
                 "Timed out waiting for action to complete during fetch with "
                 "status: pending."
@@ -2893,16 +2727,10 @@ class TestModelClient(ClientTest):
 
     def test_run(self):
         client = fake_juju_client(cls=ModelClient)
-        run_list = [
-            {"MachineId": "1",
-             "Stdout": "Linux\n",
-             "ReturnCode": 255,
-             "Stderr": "Permission denied (publickey,password)"}]
-        run_output = json.dumps(run_list)
         with patch.object(client._backend, 'get_juju_output',
-                          return_value=run_output) as gjo_mock:
+                          return_value=_RUN_OUTPUT_SAMPLE) as gjo_mock:
             result = client.run(('wname',), applications=['foo', 'bar'])
-        self.assertEqual(run_list, result)
+        self.assertEqual(_RUN_LIST_SAMPLE, result)
         gjo_mock.assert_called_once_with(
             'run', ('--format', 'json', '--application', 'foo,bar', 'wname'),
             frozenset(['migration']), 'foo',
@@ -2910,25 +2738,23 @@ class TestModelClient(ClientTest):
 
     def test_run_machines(self):
         client = fake_juju_client(cls=ModelClient)
-        output = json.dumps({"ReturnCode": 255})
         with patch.object(client, 'get_juju_output',
-                          return_value=output) as output_mock:
+                          return_value=_RUN_OUTPUT_FAIL) as output_mock:
             client.run(['true'], machines=['0', '1', '2'])
         output_mock.assert_called_once_with(
             'run', '--format', 'json', '--machine', '0,1,2', 'true')
 
     def test_run_use_json_false(self):
         client = fake_juju_client(cls=ModelClient)
-        output = json.dumps({"ReturnCode": 255})
-        with patch.object(client, 'get_juju_output', return_value=output):
+        with patch.object(client, 'get_juju_output',
+                          return_value=_RUN_OUTPUT_FAIL):
             result = client.run(['true'], use_json=False)
-        self.assertEqual(output, result)
+        self.assertEqual(_RUN_OUTPUT_FAIL, result)
 
     def test_run_units(self):
         client = fake_juju_client(cls=ModelClient)
-        output = json.dumps({"ReturnCode": 255})
         with patch.object(client, 'get_juju_output',
-                          return_value=output) as output_mock:
+                          return_value=_RUN_OUTPUT_FAIL) as output_mock:
             client.run(['true'], units=['foo/0', 'foo/1', 'foo/2'])
         output_mock.assert_called_once_with(
             'run', '--format', 'json', '--unit', 'foo/0,foo/1,foo/2', 'true')
@@ -2936,34 +2762,32 @@ class TestModelClient(ClientTest):
     def test_list_space(self):
         client = ModelClient(JujuData(None, {'type': 'lxd'}),
                              '1.23-series-arch', None)
-        yaml_dict = {'foo': 'bar'}
-        output = yaml.safe_dump(yaml_dict)
-        with patch.object(client, 'get_juju_output', return_value=output,
-                          autospec=True) as gjo_mock:
+        with patch.object(client, 'get_juju_output',
+                          return_value='foo: bar\n') as gjo_mock:
             result = client.list_space()
-        self.assertEqual(result, yaml_dict)
+        self.assertEqual(result, {'foo': 'bar'})
         gjo_mock.assert_called_once_with('list-space')
 
     def test_add_space(self):
         client = ModelClient(JujuData(None, {'type': 'lxd'}),
                              '1.23-series-arch', None)
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.add_space('foo-space')
         juju_mock.assert_called_once_with('add-space', ('foo-space'))
 
     def test_add_subnet(self):
         client = ModelClient(JujuData(None, {'type': 'lxd'}),
                              '1.23-series-arch', None)
-        with patch.object(client, 'juju', autospec=True) as juju_mock:
+        with patch_juju_call(client) as juju_mock:
             client.add_subnet('bar-subnet', 'foo-space')
         juju_mock.assert_called_once_with('add-subnet',
                                           ('bar-subnet', 'foo-space'))
 
     def test__shell_environ_uses_pathsep(self):
         client = ModelClient(JujuData('foo'), None, 'foo/bar/juju')
-        with patch('os.pathsep', '!'):
+        with patch.object(os, 'pathsep', '!'):
             environ = client._shell_environ()
-        self.assertRegexpMatches(environ['PATH'], r'foo/bar\!')
+        self.assertIn('foo/bar!', environ['PATH'])
 
     def test_set_config(self):
         client = ModelClient(JujuData('bar', {}), None, '/foo')
@@ -2972,54 +2796,26 @@ class TestModelClient(ClientTest):
         juju_mock.assert_called_once_with('config', ('foo', 'bar=baz'))
 
     def test_get_config(self):
-        def output(*args, **kwargs):
-            return yaml.safe_dump({
-                'charm': 'foo',
-                'service': 'foo',
-                'settings': {
-                    'dir': {
-                        'default': 'true',
-                        'description': 'bla bla',
-                        'type': 'string',
-                        'value': '/tmp/charm-dir',
-                    }
-                }
-            })
-        expected = yaml.safe_load(output())
         client = ModelClient(JujuData('bar', {}), None, '/foo')
         with patch.object(client, 'get_juju_output',
-                          side_effect=output) as gjo_mock:
+                          return_value=_CONFIG_YAML) as gjo_mock:
             results = client.get_config('foo')
-        self.assertEqual(expected, results)
+        self.assertEqual(_CONFIG, results)
         gjo_mock.assert_called_once_with('config', 'foo')
 
     def test_get_service_config(self):
-        def output(*args, **kwargs):
-            return yaml.safe_dump({
-                'charm': 'foo',
-                'service': 'foo',
-                'settings': {
-                    'dir': {
-                        'default': 'true',
-                        'description': 'bla bla',
-                        'type': 'string',
-                        'value': '/tmp/charm-dir',
-                    }
-                }
-            })
-        expected = yaml.safe_load(output())
         client = ModelClient(JujuData('bar', {}), None, '/foo')
-        with patch.object(client, 'get_juju_output', side_effect=output):
+        with patch.object(client, 'get_juju_output',
+                          return_value=_CONFIG_YAML):
             results = client.get_service_config('foo')
-        self.assertEqual(expected, results)
+        self.assertEqual(_CONFIG, results)
 
     def test_get_service_config_timesout(self):
         client = ModelClient(JujuData('foo', {}), None, '/foo')
-        with patch('jujupy.client.until_timeout', return_value=range(0)):
-            with self.assertRaisesRegexp(
+        with patch('jujupy.client.until_timeout', lambda timeout: []):
+            with self.assertRaisesRegex(
                     Exception, 'Timed out waiting for juju get'):
-                with patch('jujupy.client.time.sleep'):
-                    client.get_service_config('foo')
+                client.get_service_config('foo')
 
     def test_upgrade_mongo(self):
         client = ModelClient(JujuData('bar', {}), None, '/foo')
@@ -3049,15 +2845,10 @@ class TestModelClient(ClientTest):
         self.assertFalse(client.is_juju1x())
 
     def test__get_register_command_returns_register_token(self):
-        output = dedent("""\
-        User "x" added
-        User "x" granted read access to model "y"
-        Please send this command to x:
-            juju register AaBbCc""")
         output_cmd = 'AaBbCc'
         fake_client = fake_juju_client()
 
-        register_cmd = fake_client._get_register_command(output)
+        register_cmd = fake_client._get_register_command(_REGISTER_OUTPUT)
         self.assertEqual(register_cmd, output_cmd)
 
     def test_revoke(self):
@@ -3068,26 +2859,21 @@ class TestModelClient(ClientTest):
         default_model = fake_client.model_name
         default_controller = fake_client.env.controller.name
 
-        with patch_juju_call(fake_client):
+        with patch_juju_call(fake_client) as juju_mock:
             fake_client.revoke(username)
-            fake_client.juju.assert_called_with('revoke',
-                                                ('-c', default_controller,
-                                                 username, default_permissions,
-                                                 default_model),
-                                                include_e=False)
-
             fake_client.revoke(username, model)
-            fake_client.juju.assert_called_with('revoke',
-                                                ('-c', default_controller,
-                                                 username, default_permissions,
-                                                 model),
-                                                include_e=False)
-
             fake_client.revoke(username, model, permissions='write')
-            fake_client.juju.assert_called_with('revoke',
-                                                ('-c', default_controller,
-                                                 username, 'write', model),
-                                                include_e=False)
+        self.assertEqual([
+            call('revoke', ('-c', default_controller, username,
+                            default_permissions, default_model),
+                 include_e=False),
+            call('revoke', ('-c', default_controller, username,
+                            default_permissions, model),
+                 include_e=False),
+            call('revoke', ('-c', default_controller, username, 'write',
+                            model),
+                 include_e=False),
+            ], juju_mock.call_args_list)
 
     def test_add_user_perms(self):
         fake_client = fake_juju_client()
@@ -3098,52 +2884,33 @@ class TestModelClient(ClientTest):
             fake_client.add_user_perms(username),
             get_user_register_token(username))
 
-    @staticmethod
-    def assert_add_user_perms(model, permissions):
+    def test_assert_add_user_permissions(self):
         fake_client = fake_juju_client()
         username = 'fakeuser'
         output = get_user_register_command_info(username)
-        if permissions is None:
-            permissions = 'login'
-        expected_args = [username, '-c', fake_client.env.controller.name]
-        with patch.object(fake_client, 'get_juju_output',
-                          return_value=output) as get_output:
-            with patch.object(fake_client, 'juju') as mock_juju:
-                fake_client.add_user_perms(username, model, permissions)
-                if model is None:
-                    model = fake_client.env.environment
-                get_output.assert_called_with(
-                    'add-user', *expected_args, include_e=False)
-                if permissions == 'login':
-                    # Granting login is ignored, it's implicit when adding
-                    # a user.
-                    if mock_juju.call_count != 0:
-                        raise Exception(
-                            'Call count {} != 0'.format(
-                                mock_juju.call_count))
-                else:
-                    mock_juju.assert_called_once_with(
-                        'grant',
-                        ('fakeuser', permissions,
-                         model,
-                         '-c', fake_client.env.controller.name),
-                        include_e=False)
-
-    def test_assert_add_user_permissions(self):
-        model = 'foo'
-        permissions = 'write'
-
-        # Check using default model and permissions
-        self.assert_add_user_perms(None, None)
-
-        # Check explicit model & default permissions
-        self.assert_add_user_perms(model, None)
-
-        # Check explicit model & permissions
-        self.assert_add_user_perms(model, permissions)
-
-        # Check default model & explicit permissions
-        self.assert_add_user_perms(None, permissions)
+        controller_name = fake_client.env.controller.name
+        default_model = fake_client.env.environment
+        for model, permissions in _ADD_USER_PERMS_CASES:
+            with patch.object(fake_client, 'get_juju_output',
+                              return_value=output) as get_output:
+                with patch_juju_call(fake_client) as mock_juju:
+                    fake_client.add_user_perms(
+                        username, model, permissions or 'login')
+            case = (model, permissions)
+            self.assertEqual(
+                call('add-user', username, '-c', controller_name,
+                     include_e=False),
+                get_output.call_args, case)
+            if permissions is None:
+                # Granting login is ignored, it's implicit when adding a user.
+                self.assertEqual(0, mock_juju.call_count, case)
+            else:
+                self.assertEqual(
+                    [call('grant', (username, permissions,
+                                    model or default_model,
+                                    '-c', controller_name),
+                          include_e=False)],
+                    mock_juju.call_args_list, case)
 
     def test_disable_user(self):
         env = JujuData('foo')
@@ -3337,15 +3104,10 @@ class TestModelClient(ClientTest):
             'show-controller', '--format', 'json', include_e=False)
 
     def test_show_machine(self):
-        output = """\
-        machines:
-          "0":
-            series: bionic
-        """
         env = JujuData('foo')
         client = ModelClient(env, None, None)
-        with patch.object(client, 'get_juju_output', autospec=True,
-                          return_value=output) as mock:
+        with patch.object(client, 'get_juju_output',
+                          return_value=_SHOW_MACHINE_YAML) as mock:
             data = client.show_machine('0')
         mock.assert_called_once_with('show-machine', '0', '--format', 'yaml')
         self.assertEqual({'machines': {'0': {'series': 'bionic'}}}, data)
@@ -3353,7 +3115,7 @@ class TestModelClient(ClientTest):
     def test_ssh_keys(self):
         client = ModelClient(JujuData('foo'), None, None)
         given_output = 'ssh keys output'
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value=given_output) as mock:
             output = client.ssh_keys()
         self.assertEqual(output, given_output)
@@ -3362,7 +3124,7 @@ class TestModelClient(ClientTest):
     def test_ssh_keys_full(self):
         client = ModelClient(JujuData('foo'), None, None)
         given_output = 'ssh keys full output'
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value=given_output) as mock:
             output = client.ssh_keys(full=True)
         self.assertEqual(output, given_output)
@@ -3370,7 +3132,7 @@ class TestModelClient(ClientTest):
 
     def test_add_ssh_key(self):
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value='') as mock:
             output = client.add_ssh_key('ak', 'bk')
         self.assertEqual(output, '')
@@ -3379,7 +3141,7 @@ class TestModelClient(ClientTest):
 
     def test_remove_ssh_key(self):
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value='') as mock:
             output = client.remove_ssh_key('ak', 'bk')
         self.assertEqual(output, '')
@@ -3388,7 +3150,7 @@ class TestModelClient(ClientTest):
 
     def test_import_ssh_key(self):
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output', autospec=True,
+        with patch.object(client, 'get_juju_output',
                           return_value='') as mock:
             output = client.import_ssh_key('gh:au', 'lp:bu')
         self.assertEqual(output, '')
@@ -3403,11 +3165,8 @@ class TestModelClient(ClientTest):
 
     def test_list_disabled_commands(self):
         client = ModelClient(JujuData('foo'), None, None)
-        with patch.object(client, 'get_juju_output', autospec=True,
-                          return_value=dedent("""\
-             - command-set: destroy-model
-               message: Lock Models
-             - command-set: remove-object""")) as mock:
+        with patch.object(client, 'get_juju_output',
+                          return_value=_DISABLED_COMMANDS_YAML) as mock:
             output = client.list_disabled_commands()
         self.assertEqual([{'command-set': 'destroy-model',
                            'message': 'Lock Models'},
@@ -3615,7 +3374,7 @@ class TestJujuData(TestCase):
     def test_for_existing(self):
         with temp_dir() as juju_home:
             with open(get_bootstrap_config_path(juju_home), 'w') as f:
-                yaml.safe_dump({'controllers': {'foo': {
+                safe_dump({'controllers': {'foo': {
                     'controller-config': {
                         'ctrl1': 'ctrl2',
                         'duplicated1': 'duplicated2',
@@ -3720,7 +3479,7 @@ class TestJujuData(TestCase):
 
     def test_update_config_type(self):
         env = JujuData('foo', {'type': 'azure'}, juju_home='')
-        with self.assertRaisesRegexp(
+        with self.assertRaisesRegex(
                 ValueError, 'type cannot be set via update_config.'):
             env.update_config({'type': 'foo1'})
 
@@ -3728,7 +3487,7 @@ class TestJujuData(TestCase):
         env = JujuData('foo', {'type': 'azure'}, juju_home='',
                        cloud_name='steve')
         for endpoint_key in ['maas-server', 'auth-url', 'host']:
-            with self.assertRaisesRegexp(
+            with self.assertRaisesRegex(
                     ValueError, '{} cannot be changed with'
                     ' explicit cloud name.'.format(endpoint_key)):
                 env.update_config({endpoint_key: 'foo1'})
@@ -3764,7 +3523,7 @@ class TestJujuData(TestCase):
         data.clouds = {'clouds': {
             'baz': {'type': 'foo', 'endpoint': 'bar'},
             }}
-        with self.assertRaisesRegexp(LookupError, 'No such endpoint: bar'):
+        with self.assertRaisesRegex(LookupError, 'No such endpoint: bar'):
             self.assertEqual(data.get_cloud())
 
     def test_get_cloud_openstack(self):
@@ -3782,7 +3541,7 @@ class TestJujuData(TestCase):
         data.clouds = {'clouds': {
             'baz': {'type': 'maas', 'endpoint': 'bar'},
             }}
-        with self.assertRaisesRegexp(LookupError, 'No such endpoint: bar'):
+        with self.assertRaisesRegex(LookupError, 'No such endpoint: bar'):
             data.get_cloud()
 
     def test_get_cloud_vsphere(self):
@@ -3860,8 +3619,8 @@ class TestJujuData(TestCase):
 
     def test_set_region_maas(self):
         env = JujuData('foo', {'type': 'maas'}, 'home')
-        with self.assertRaisesRegexp(ValueError,
-                                     'Only None allowed for maas.'):
+        with self.assertRaisesRegex(ValueError,
+                                    'Only None allowed for maas.'):
             env.set_region('baz')
         env.set_region(None)
         self.assertIs(env.get_region(), None)
@@ -3930,18 +3689,18 @@ class TestJujuData(TestCase):
             self.assertItemsEqual(
                 ['clouds.yaml', 'credentials.yaml'], os.listdir(path))
             with open(os.path.join(path, 'clouds.yaml')) as f:
-                self.assertEqual(cloud_dict, yaml.safe_load(f))
+                self.assertEqual(cloud_dict, safe_load(f))
             with open(os.path.join(path, 'credentials.yaml')) as f:
-                self.assertEqual(credential_dict, yaml.safe_load(f))
+                self.assertEqual(credential_dict, safe_load(f))
 
     def test_load_yaml(self):
         cloud_dict = {'clouds': {'foo': {}}}
         credential_dict = {'credential': {'bar': {}}}
         with temp_dir() as path:
             with open(os.path.join(path, 'clouds.yaml'), 'w') as f:
-                yaml.safe_dump(cloud_dict, f)
+                safe_dump(cloud_dict, f)
             with open(os.path.join(path, 'credentials.yaml'), 'w') as f:
-                yaml.safe_dump(credential_dict, f)
+                safe_dump(credential_dict, f)
             data = JujuData('baz', {'type': 'qux'}, path)
             data.load_yaml()
 
@@ -78,7 +78,7 @@ class TestStatusItem(TestCase):
     def test_to_exception_stuck_allocating(self):
         item = self.make_status_item(StatusItem.MACHINE, '0',
                                      current='allocating', message='foo')
-        with self.assertRaisesRegexp(
+        with self.assertRaisesRegex(
                 StuckAllocatingError,
                 "\('0', 'Stuck allocating.  Last message: foo'\)"):
             raise item.to_exception()
@@ -325,7 +325,7 @@ class TestStatus(FakeHomeTestCase):
             status.get_unit('jenkins/1'), {'agent-state': 'bad'})
         self.assertEqual(
             status.get_unit('jenkins/2'), {'agent-state': 'started'})
-        with self.assertRaisesRegexp(KeyError, 'jenkins/3'):
+        with self.assertRaisesRegex(KeyError, 'jenkins/3'):
             status.get_unit('jenkins/3')
 
     def test_service_subordinate_units(self):
@@ -587,8 +587,8 @@ class TestStatus(FakeHomeTestCase):
             },
             'applications': {}
         }, '')
-        with self.assertRaisesRegexp(ErroredUnit,
-                                     '1 is in state any-error'):
+        with self.assertRaisesRegex(ErroredUnit,
+                                    '1 is in state any-error'):
             status.check_agents_started('env1')
 
     def do_check_agents_started_agent_state_info_failure(self, failure):
@@ -648,8 +648,8 @@ class TestStatus(FakeHomeTestCase):
             },
             'applications': {}
         }, '')
-        with self.assertRaisesRegexp(ErroredUnit,
-                                     '1 is in state any-error'):
+        with self.assertRaisesRegex(ErroredUnit,
+                                    '1 is in state any-error'):
             status.check_agents_started('env1')
 
     def test_get_agent_versions_1x(self):
@@ -768,9 +768,9 @@ class TestStatus(FakeHomeTestCase):
             }
         }, '')
         self.assertEqual(status.get_machine_dns_name('0'), '255.1.1.0')
-        with self.assertRaisesRegexp(KeyError, 'dns-name'):
+        with self.assertRaisesRegex(KeyError, 'dns-name'):
             status.get_machine_dns_name('1')
-        with self.assertRaisesRegexp(KeyError, '2'):
+        with self.assertRaisesRegex(KeyError, '2'):
             status.get_machine_dns_name('2')
 
     def test_from_text(self):
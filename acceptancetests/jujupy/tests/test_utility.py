@@ -11,6 +11,7 @@ try:
     from mock import patch
 except ImportError:
     from unittest.mock import patch
+import yaml
 
 from tests import (
     TestCase,
@@ -19,6 +20,8 @@ import jujupy.utility
 from jujupy.utility import (
     is_ipv6_address,
     quote,
+    safe_dump,
+    safe_load,
     scoped_environ,
     skip_on_missing_file,
     split_address_port,
@@ -141,6 +144,41 @@ class TestQuote(TestCase):
         self.assertEqual(quote("bob's"), "'bob'\"'\"'s'")
 
 
+class TestSafeLoad(TestCase):
+
+    def test_safe_load(self):
+        self.assertEqual({'foo': ['bar', 1]}, safe_load('foo: [bar, 1]'))
+
+    def test_safe_load_rejects_python_objects(self):
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            safe_load('!!python/object/apply:os.getcwd []')
+
+
+class TestSafeDump(TestCase):
+
+    def test_safe_dump(self):
+        data = {'foo': ['bar', 1]}
+        self.assertEqual(data, safe_load(safe_dump(data)))
+
+    def test_safe_dump_rejects_python_objects(self):
+        with self.assertRaises(yaml.representer.RepresenterError):
+            safe_dump(object())
+
+    def test_pure_python_fallback(self):
+        # The C classes are used when libyaml is available; check the
+        # pure-Python fallback gives the same results.
+        data = {'foo': ['bar', 1], 'baz': {'qux': None}}
+        c_text = safe_dump(data)
+        with patch.object(jujupy.utility, '_SafeLoader', yaml.SafeLoader):
+            with patch.object(jujupy.utility, '_SafeDumper',
+                              yaml.SafeDumper):
+                py_text = safe_dump(data)
+                self.assertEqual(data, safe_load(py_text))
+                self.assertEqual(data, safe_load(c_text))
+        self.assertEqual(c_text, py_text)
+        self.assertEqual(data, safe_load(py_text))
+
+
 class TestScopedEnviron(TestCase):
 
     def test_scoped_environ(self):
@@ -97,7 +97,7 @@ class TestWaitMachineNotPresent(TestCase):
 
     def test_do_raise(self):
         not_present = WaitMachineNotPresent('0')
-        with self.assertRaisesRegexp(
+        with self.assertRaisesRegex(
                 Exception, 'Timed out waiting for machine removal 0'):
             not_present.do_raise('', None)
 
@@ -120,7 +120,7 @@ class TestWaitApplicationNotPresent(TestCase):
 
     def test_do_raise(self):
         not_present = WaitApplicationNotPresent('foo')
-        with self.assertRaisesRegexp(
+        with self.assertRaisesRegex(
                 Exception, 'Timed out waiting for application removal foo'):
             not_present.do_raise('', None)
 
@@ -143,7 +143,7 @@ class TestMachineDown(TestCase):
 
     def test_do_raise(self):
         down = MachineDown('0')
-        with self.assertRaisesRegexp(
+        with self.assertRaisesRegex(
                 Exception,
                 'Timed out waiting for juju to determine machine 0 down.'):
             down.do_raise('', None)
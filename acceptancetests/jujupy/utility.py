@@ -43,6 +43,20 @@ quote
 
 log = logging.getLogger("jujupy.utility")
 
+# Use libyaml's loader and dumper where available; they are much faster.
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+def safe_load(stream):
+    """Parse YAML like yaml.safe_load, using libyaml if it is available."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def safe_dump(data, stream=None, **kwargs):
+    """Emit YAML like yaml.safe_dump, using libyaml if it is available."""
+    return yaml.dump(data, stream, Dumper=_SafeDumper, **kwargs)
+
 
 @contextmanager
 def scoped_environ(new_environ=None):
@@ -176,7 +190,7 @@ def temp_yaml_file(yaml_dict, encoding="utf-8"):
     temp_file_cxt = NamedTemporaryFile(suffix='.yaml', delete=False)
     try:
         with temp_file_cxt as temp_file:
-            yaml.safe_dump(yaml_dict, temp_file, encoding=encoding)
+            safe_dump(yaml_dict, temp_file, encoding=encoding)
         yield temp_file.name
     finally:
         os.unlink(temp_file.name)
@@ -11,13 +11,20 @@ except ImportError:
     from io import StringIO
 import subprocess
 import sys
-from tempfile import NamedTemporaryFile
 import unittest
 
 try:
-    from mock import patch
+    from mock import (
+        call,
+        Mock,
+        patch,
+        )
 except ImportError:
-    from unittest.mock import patch
+    from unittest.mock import (
+        call,
+        Mock,
+        patch,
+        )
 import yaml
 
 from jujupy.wait_condition import (
@@ -88,6 +95,13 @@ class TestCase(unittest.TestCase):
 if getattr(TestCase, 'assertItemsEqual', None) is None:
     TestCase.assertItemsEqual = TestCase.assertCountEqual
 
+# Python 2 only has the deprecated spellings, which Python 3.12 removes.
+if getattr(TestCase, 'assertRaisesRegex', None) is None:
+    TestCase.assertRaisesRegex = TestCase.assertRaisesRegexp
+
+if getattr(TestCase, 'assertRegex', None) is None:
+    TestCase.assertRegex = TestCase.assertRegexpMatches
+
 
 class FakeHomeTestCase(TestCase):
     """FakeHomeTestCase creates an isolated home dir for Juju to use."""
@@ -162,8 +176,9 @@ def patch_juju_call(client, return_value=0):
     :param return_value: A tuple to return representing the retvar and
       CommandTime object
     """
+    # A plain Mock is enough for juju() and is far cheaper than a MagicMock.
     with patch.object(
-            client, 'juju',
+            client, 'juju', new_callable=Mock,
             return_value=make_fake_juju_return(retvar=return_value)) as mock:
         yield mock
 
@@ -181,53 +196,79 @@ def assert_juju_call(test_case, mock_method, client, expected_args,
     if call_index is None:
         test_case.assertEqual(len(mock_method.mock_calls), 1)
         call_index = 0
-    empty, args, kwargs = mock_method.mock_calls[call_index]
-    test_case.assertEqual(args, (expected_args,))
+    actual = mock_method.mock_calls[call_index]
+    # Keyword arguments are not checked, so take them from the actual call.
+    test_case.assertEqual(call(expected_args, **actual[2]), actual)
 
 
 class FakePopen(object):
     """Create an artifical version of the Popen class."""
 
+    __slots__ = ('_result', '_code', 'returncode')
+
     def __init__(self, out, err, returncode):
-        self._out = out if out is None else out.encode('ascii')
-        self._err = err if err is None else err.encode('ascii')
+        self._result = (out if out is None else out.encode('ascii'),
+                        err if err is None else err.encode('ascii'))
         self._code = returncode
 
     def communicate(self):
         self.returncode = self._code
-        return self._out, self._err
+        return self._result
 
     def poll(self):
         return self._code
 
 
+class InMemoryTempFile(io.BytesIO):
+    """A BytesIO standing in for a NamedTemporaryFile, with a fake name."""
+
+    def __init__(self, name='observable-temp-file'):
+        super(InMemoryTempFile, self).__init__()
+        self.name = name
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Leave the file open so the contents stay readable.
+        return False
+
+
+class _SkipUnlinkOs(object):
+    """Stand-in for jujupy.utility's os that does not unlink one name.
+
+    temp_yaml_file removes its file when done, but there is nothing on disk
+    for an InMemoryTempFile. Only jujupy.utility sees this object, so the
+    real os.unlink is untouched everywhere else."""
+
+    def __init__(self, skip_name):
+        self._skip_name = skip_name
+
+    def unlink(self, path):
+        if path != self._skip_name:
+            os.unlink(path)
+
+    def __getattr__(self, name):
+        return getattr(os, name)
+
+
 @contextmanager
 def observable_temp_file():
-    """Get a name which is used to create temporary files in the context."""
-    temporary_file = NamedTemporaryFile(delete=False)
-    try:
-        with temporary_file as temp_file:
+    """Get a name which is used to create temporary files in the context.
 
-            @contextmanager
-            def nt():
-                # This is used to prevent NamedTemporaryFile.close from being
-                # called.
-                yield temporary_file
+    The contents are kept in memory; nothing is written to disk."""
+    temp_file = InMemoryTempFile()
+    with patch('jujupy.utility.NamedTemporaryFile', return_value=temp_file):
+        with patch('jujupy.utility.os', _SkipUnlinkOs(temp_file.name)):
+            yield temp_file
 
-            with patch('jujupy.utility.NamedTemporaryFile',
-                       return_value=nt()):
-                yield temp_file
-    finally:
-        # File may have already been deleted, e.g. by temp_yaml_file.
-        with utility.skip_on_missing_file():
-            os.unlink(temporary_file.name)
+
+_PAST_SOFT_DEADLINE = datetime.datetime(2015, 1, 2, 3, 4, 6)
+_PAST_DEADLINE_NOW = _PAST_SOFT_DEADLINE + datetime.timedelta(seconds=1)
 
 
 @contextmanager
 def client_past_deadline(client):
     """Create a client patched to be past its deadline."""
-    soft_deadline = datetime.datetime(2015, 1, 2, 3, 4, 6)
-    now = soft_deadline + datetime.timedelta(seconds=1)
+    soft_deadline = _PAST_SOFT_DEADLINE
+    now = _PAST_DEADLINE_NOW
     old_soft_deadline = client._backend.soft_deadline
     client._backend.soft_deadline = soft_deadline
     try: